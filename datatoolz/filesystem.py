@@ -1,22 +1,46 @@
 """Module providing a FileSystem wrapper class"""
 
-import inspect
+import os
+from functools import lru_cache, partial
+from types import FunctionType
 
-import botocore.session
-import botocore.credentials
-import s3fs
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
-from .utils import _getmembers
+from fsspec.implementations.memory import MemoryFileSystem
+
+STS_DURATION_SECONDS = 3600
+STS_ADVISORY_REFRESH_TIMEOUT = 15 * 60
+STS_MANDATORY_REFRESH_TIMEOUT = 10 * 60
+S3_FILESYSTEM_CACHE_SIZE = 8
+DELEGATED_ATTRIBUTES = ("protocol", "root_marker", "sep")
+SESSION_ENV_VARIABLES = (
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_SHARED_CREDENTIALS_FILE",
+    "AWS_CONFIG_FILE",
+)
+SESSION_CONFIG_FILES = (
+    ("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials"),
+    ("AWS_CONFIG_FILE", "~/.aws/config"),
+)
 
 
 class FileSystem(AbstractFileSystem):
     """Wrapper for easier initialization of various file-system classes"""
 
+    # the wrapped filesystems are cached instead (see `_get_s3_filesystem`),
+    # fsspec's per-arguments instance cache would ignore credential changes
+    cachable = False
+
     def __init__(self, name="local", assumed_role=None, endpoint_url=None):
         """
         FileSystem initializer
-        :param name: str, filesystem type, supported values [local|s3]
+        :param name: str, filesystem type, supported values [local|s3|memory]
         :param assumed_role: optional str|list,
             permission assume chain - relevant for [s3]
         :param endpoint_url: optional str, override storage service url
@@ -29,82 +53,51 @@ class FileSystem(AbstractFileSystem):
         if isinstance(self.assume_role, str):
             self.assume_role = [self.assume_role]
         self.endpoint_url = endpoint_url
+        self._filesystem_pid = None
 
         if self.name == "local":
-            self.filesystem = LocalFileSystem()
+            self._filesystem = LocalFileSystem()
+        elif self.name == "memory":
+            self._filesystem = MemoryFileSystem()
         elif self.name == "s3":
-            session = botocore.session.get_session()
-            if self.assume_role:
-                session_credentials = (
-                    botocore.credentials.RefreshableCredentials.create_from_metadata(
-                        metadata=self._sts_refresh(),
-                        refresh_using=self._sts_refresh,
-                        method="sts-assume-role",
-                    )
-                )
-                session._credentials = session_credentials
-
-            client_kwargs = {"endpoint_url": endpoint_url} if endpoint_url else None
-            self.filesystem = s3fs.S3FileSystem(
-                session=session, client_kwargs=client_kwargs
-            )
+            # the session (and STS round-trips) are only set up on first use
+            self._filesystem = None
+            self._filesystem_args = {
+                "assume_chain": tuple(self.assume_role or ()),
+                "endpoint_url": endpoint_url,
+                "session_fingerprint": _session_fingerprint(),
+            }
         else:
             raise ValueError(f"Unsupported FileReader type: {type}")
 
-        for method_name, method in _getmembers(
-            self.filesystem, predicate=inspect.ismethod
-        ):
-            if method_name not in (
-                "__init__",
-                "_rm",
-                "cp_file",
-                "created",
-                "ls",
-                "modified",
-                "sign",
-                "fsid",
-            ):
-                setattr(self, method_name, method)
-
-    def _sts_refresh(self):
-        """Refresh tokens by calling assume_role again"""
-
-        session = botocore.session.get_session()
-        credentials = {}
-        kwargs = {}
-
-        for role in self.assume_role:
-            if credentials:
-                kwargs = {
-                    "aws_access_key_id": credentials["AccessKeyId"],
-                    "aws_secret_access_key": credentials["SecretAccessKey"],
-                    "aws_session_token": credentials["SessionToken"],
-                }
-            assume_client = session.create_client("sts", **kwargs)
-
-            credentials = assume_client.assume_role(
-                RoleArn=role,
-                RoleSessionName="data-toolz-filesystem-s3",
-                DurationSeconds=3600,
-            ).get("Credentials")
-
-            setattr(
-                session,
-                "_credentials",
-                botocore.credentials.Credentials(
-                    access_key=credentials["AccessKeyId"],
-                    secret_key=credentials["SecretAccessKey"],
-                    token=credentials["SessionToken"],
-                ),
-            )
+    @property
+    def filesystem(self):
+        """
+        The wrapped fsspec filesystem, s3 is created lazily - and again in a
+        forked child, which must not share the parent's clients and connections
+        """
+        if self.name == "s3" and self._filesystem_pid != os.getpid():
+            try:
+                self._filesystem = _get_s3_filesystem(**self._filesystem_args)
+            except AttributeError as error:
+                # would be reported by `__getattr__` as a missing attribute
+                raise RuntimeError(
+                    f"Failed to create s3 filesystem: {error}"
+                ) from error
+            self._filesystem_pid = os.getpid()
+        return self._filesystem
 
-        del session
-        return {
-            "access_key": credentials.get("AccessKeyId"),
-            "secret_key": credentials.get("SecretAccessKey"),
-            "token": credentials.get("SessionToken"),
-            "expiry_time": credentials.get("Expiration").isoformat(),
-        }
+    def __getattr__(self, name):
+        """Delegate attributes missing on the wrapper to the wrapped filesystem"""
+        if name in (
+            "name",
+            "filesystem",
+            "_filesystem",
+            "_filesystem_args",
+            "_filesystem_pid",
+        ):
+            raise AttributeError(name)
+        return getattr(self.filesystem, name)
 
     def _rm(self, path):
         return self.filesystem.rm(path=path)
@@ -115,6 +108,32 @@ class FileSystem(AbstractFileSystem):
     def created(self, path):
         return self.filesystem.created(path=path)
 
+    def find(self, path, maxdepth=None, withdirs=False, detail=False, **kwargs):
+        if not (withdirs or detail or kwargs):
+            if self.name == "local":
+                return _find_local(
+                    filesystem=self.filesystem, path=path, maxdepth=maxdepth
+                )
+            if maxdepth is None:
+                return list(self.iter_find(path=path))
+        return self.filesystem.find(
+            path=path, maxdepth=maxdepth, withdirs=withdirs, detail=detail, **kwargs
+        )
+
+    def iter_find(self, path):
+        """
+        Lazy `find`, for s3 the files are yielded as the listing pages arrive,
+        for local as the directories are read
+        :param path: path-like
+        :return: generator of file paths
+        """
+        if self.name == "s3":
+            yield from _iter_find_s3(filesystem=self.filesystem, path=path)
+        elif self.name == "local":
+            yield from _iter_find_local(filesystem=self.filesystem, path=path)
+        else:
+            yield from self.filesystem.find(path=path)
+
     def ls(self, path, detail=True, **kwargs):
         return self.filesystem.ls(path=path, detail=detail, **kwargs)
 
@@ -127,3 +146,232 @@ class FileSystem(AbstractFileSystem):
     @property
     def fsid(self):
         return self.filesystem.fsid()
+
+
+class _Delegated:  # pylint: disable=too-few-public-methods
+    """
+    Descriptor forwarding `name` to the wrapped filesystem on instances,
+    class-level access (e.g. fsspec calling `_strip_protocol`) gets the
+    inherited AbstractFileSystem attribute
+    """
+
+    def __init__(self, name, inherited):
+        self.name = name
+        self.inherited = inherited
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if hasattr(self.inherited, "__get__"):
+                return self.inherited.__get__(None, owner)
+            return self.inherited
+        return getattr(instance.filesystem, self.name)
+
+
+# methods and path-format attributes inherited from AbstractFileSystem would
+# shadow `__getattr__`, so these are explicitly forwarded to the wrapped filesystem
+for _name, _value in vars(AbstractFileSystem).items():
+    if (
+        not _name.startswith("__")
+        and _name not in vars(FileSystem)
+        and (
+            isinstance(_value, (FunctionType, classmethod, staticmethod))
+            or _name in DELEGATED_ATTRIBUTES
+        )
+    ):
+        setattr(FileSystem, _name, _Delegated(name=_name, inherited=_value))
+
+
+def _iter_find_s3(filesystem, path):
+    """
+    `find` for s3 in a single flat listing - instead of one listing per
+    (partition) directory, and without a separate request when `path` is a file
+    :param filesystem: s3fs.S3FileSystem
+    :param path: path-like
+    :return: generator of sorted file paths (page by page), `path` if it is a file
+    """
+    if getattr(filesystem, "async_impl", False):
+        # async s3fs has no sync client, its `find` is a single flat listing too
+        yield from filesystem.find(path)
+        return
+
+    bucket, key, _ = filesystem.split_path(path)
+    key = key.rstrip("/")
+    directory = f"{key}/" if key else ""
+
+    paginator = filesystem.s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(Bucket=bucket, Prefix=key, **filesystem.req_kw)
+    found, is_file = False, False
+    for name in (item["Key"] for page in pages for item in page.get("Contents", [])):
+        if name == key:
+            is_file = True
+        elif name.startswith(directory):
+            if not name.endswith("/"):
+                found = True
+                yield f"{bucket}/{name}"
+        elif name > directory:
+            # listings are sorted, nothing below `directory` follows
+            break
+
+    if not found and is_file:
+        yield f"{bucket}/{key}"
+
+
+def _find_local(filesystem, path, maxdepth=None):
+    """
+    `find` for the local filesystem, see `_iter_find_local`
+    :param filesystem: fsspec LocalFileSystem
+    :param path: path-like
+    :param maxdepth: optional int, maximum number of directory levels to descend
+    :return: list of sorted file paths, `[path]` if it is a file
+    """
+    if maxdepth is not None and maxdepth < 1:
+        raise ValueError("maxdepth must be at least 1")
+    return list(_iter_find_local(filesystem=filesystem, path=path, maxdepth=maxdepth))
+
+
+def _iter_find_local(filesystem, path, maxdepth=None):
+    """
+    Lazy `find` for the local filesystem with `os.scandir`, the entry types come
+    from the directory read instead of a `stat` per file and only the pending
+    entries of the directories being walked are held in memory
+    :param filesystem: fsspec LocalFileSystem
+    :param path: path-like
+    :param maxdepth: optional int, maximum number of directory levels to descend
+    :return: generator of sorted file paths, `path` if it is a file
+    """
+    path = filesystem._strip_protocol(path)  # pylint: disable=protected-access
+    found = False
+    # depth-first, directories sort as `name/` so the output order matches
+    # sorting the full paths
+    stack = [(path, True, 0)]
+    while stack:
+        current, is_dir, depth = stack.pop()
+        if not is_dir:
+            found = True
+            yield current
+            continue
+        if maxdepth is not None and depth >= maxdepth:
+            continue
+        try:
+            with os.scandir(current) as entries:
+                children = sorted(
+                    (entry.name + "/", True) if entry.is_dir() else (entry.name, False)
+                    for entry in entries
+                )
+        except OSError:
+            continue
+        prefix = current if current.endswith("/") else current + "/"
+        stack.extend(
+            (prefix + name.rstrip("/"), is_dir, depth + 1)
+            for name, is_dir in reversed(children)
+        )
+
+    if not found and os.path.isfile(path):
+        yield path
+
+
+def _session_fingerprint():
+    """
+    Cheap fingerprint of the ambient AWS credentials configuration - the
+    credential environment variables and the modification times of the shared
+    credentials/config files - so that rotating keys or switching profiles
+    in-process does not reuse a stale S3FileSystem
+    """
+    return tuple(
+        os.environ.get(variable) for variable in SESSION_ENV_VARIABLES
+    ) + tuple(
+        _modified_ns(os.path.expanduser(os.environ.get(variable, default)))
+        for variable, default in SESSION_CONFIG_FILES
+    )
+
+
+def _modified_ns(path):
+    """Modification time of `path` in ns, None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=S3_FILESYSTEM_CACHE_SIZE)
+def _get_s3_filesystem(assume_chain, endpoint_url, session_fingerprint):
+    """
+    Cached s3fs.S3FileSystem factory - one session per assume chain, endpoint
+    and ambient credentials
+    :param assume_chain: tuple, permission assume chain
+    :param endpoint_url: optional str, override storage service url
+    :param session_fingerprint: tuple, see `_session_fingerprint`
+    :return: s3fs.S3FileSystem
+    """
+    # pylint: disable=unused-argument,import-outside-toplevel
+    # s3 dependencies are heavy to import, only load them for s3 filesystems
+    import botocore.session
+    import botocore.credentials
+    import s3fs
+
+    session = botocore.session.get_session()
+    if assume_chain:
+        session_credentials = (
+            botocore.credentials.RefreshableCredentials.create_from_metadata(
+                metadata=_sts_refresh(assume_chain=assume_chain),
+                refresh_using=partial(_sts_refresh, assume_chain=assume_chain),
+                method="sts-assume-role",
+            )
+        )
+        # pylint: disable=protected-access
+        session_credentials._advisory_refresh_timeout = STS_ADVISORY_REFRESH_TIMEOUT
+        session_credentials._mandatory_refresh_timeout = STS_MANDATORY_REFRESH_TIMEOUT
+        session._credentials = session_credentials
+
+    client_kwargs = {"endpoint_url": endpoint_url} if endpoint_url else None
+    return s3fs.S3FileSystem(session=session, client_kwargs=client_kwargs)
+
+
+if hasattr(os, "register_at_fork"):
+    # a forked child would reuse the parent's botocore clients (and their
+    # connection pools), the child creates its own filesystems instead
+    os.register_at_fork(after_in_child=_get_s3_filesystem.cache_clear)
+
+
+def _sts_refresh(assume_chain):
+    """Refresh tokens by calling assume_role again"""
+    # pylint: disable=import-outside-toplevel
+    import botocore.session
+    import botocore.credentials
+
+    session = botocore.session.get_session()
+    credentials = {}
+    kwargs = {}
+
+    for role in assume_chain:
+        if credentials:
+            kwargs = {
+                "aws_access_key_id": credentials["AccessKeyId"],
+                "aws_secret_access_key": credentials["SecretAccessKey"],
+                "aws_session_token": credentials["SessionToken"],
+            }
+        assume_client = session.create_client("sts", **kwargs)
+
+        credentials = assume_client.assume_role(
+            RoleArn=role,
+            RoleSessionName="data-toolz-filesystem-s3",
+            DurationSeconds=STS_DURATION_SECONDS,
+        ).get("Credentials")
+
+        setattr(
+            session,
+            "_credentials",
+            botocore.credentials.Credentials(
+                access_key=credentials["AccessKeyId"],
+                secret_key=credentials["SecretAccessKey"],
+                token=credentials["SessionToken"],
+            ),
+        )
+
+    del session
+    return {
+        "access_key": credentials.get("AccessKeyId"),
+        "secret_key": credentials.get("SecretAccessKey"),
+        "token": credentials.get("SessionToken"),
+        "expiry_time": credentials.get("Expiration").isoformat(),
+    }
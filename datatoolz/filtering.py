@@ -5,8 +5,13 @@ https://docs.aws.amazon.com/lambda/latest/dg/invocation-eventfiltering.html#filt
 
 # pylint: disable=line-too-long, too-few-public-methods
 
+from collections.abc import Mapping
 from enum import Enum
+from functools import partial
 from operator import eq, ge, gt, le, lt
+
+import numpy as np
+
 from .utils import pairwise
 
 
@@ -29,99 +34,281 @@ NUMERIC_OPERATORS = {
     "<=": le,
 }
 
+_MISSING = object()
+
 
-def _filter_value(value, criterium, err):
-    return (value == criterium) if not err else False
+def _compile_value(criterium):
+    def _match(value, err):
+        return (value == criterium) if not err else False
 
+    return _match
 
-def _filter_anything_but(value, criterium, err):
-    if not isinstance(criterium[CriteriumType.ANYTHING_BUT.value], list):
+
+def _compile_anything_but(criterium):
+    reference = criterium[CriteriumType.ANYTHING_BUT.value]
+    if not isinstance(reference, list):
         raise ValueError(
             f"'{CriteriumType.ANYTHING_BUT.value}' criterium reference must be a list of values"
         )
-    return (
-        (value not in criterium[CriteriumType.ANYTHING_BUT.value]) if not err else False
-    )
 
+    def _match(value, err):
+        return (value not in reference) if not err else False
 
-def _filter_numeric(value, criterium, err):
-    if not len(criterium[CriteriumType.NUMERIC.value]) % 2 == 0:
+    return _match
+
+
+def _compile_numeric(criterium):
+    reference = criterium[CriteriumType.NUMERIC.value]
+    if not len(reference) % 2 == 0:
         raise ValueError(
             f"'{CriteriumType.NUMERIC.value}' criterium reference must be an even sized array in form of [operation1, reference_value1, ...]"
         )
-    return (
-        (
-            all(
-                NUMERIC_OPERATORS[op](value, ref)
-                for op, ref in pairwise(criterium[CriteriumType.NUMERIC.value])
-            )
-        )
-        if not err
-        else False
-    )
+    conditions = [(NUMERIC_OPERATORS[op], ref) for op, ref in pairwise(reference)]
+
+    # single comparisons and ranges (the common shapes) are bound directly,
+    # e.g. [">=", 0, "<", 100] -> ge(value, 0) and lt(value, 100)
+    if len(conditions) == 1:
+        ((op, ref),) = conditions
 
+        def _match(value, err):
+            return op(value, ref) if not err else False
 
-def _filter_exists(_, criterium, err):
-    return (criterium[CriteriumType.EXISTS.value]) == (err is None)
+    elif len(conditions) == 2:
+        (op1, ref1), (op2, ref2) = conditions
 
+        def _match(value, err):
+            return (op1(value, ref1) and op2(value, ref2)) if not err else False
 
-def _filter_prefix(value, criterium, err):
-    if not isinstance(criterium[CriteriumType.PREFIX.value], str):
+    else:
+
+        def _match(value, err):
+            return all(op(value, ref) for op, ref in conditions) if not err else False
+
+    return _match
+
+
+def _compile_exists(criterium):
+    reference = criterium[CriteriumType.EXISTS.value]
+
+    def _match(_, err):
+        return reference == (not err)
+
+    return _match
+
+
+def _compile_prefix(criterium):
+    reference = criterium[CriteriumType.PREFIX.value]
+    if not isinstance(reference, str):
         raise ValueError(
             f"'{CriteriumType.PREFIX.value}' criterium reference must be a string"
         )
-    return (
-        (
-            isinstance(value, str)
-            and value.startswith(criterium[CriteriumType.PREFIX.value])
+
+    def _match(value, err):
+        return (
+            (isinstance(value, str) and value.startswith(reference))
+            if not err
+            else False
         )
-        if not err
-        else False
-    )
+
+    return _match
+
+
+CRITERIUM_COMPILERS = {
+    CriteriumType.ANYTHING_BUT.value: _compile_anything_but,
+    CriteriumType.NUMERIC.value: _compile_numeric,
+    CriteriumType.EXISTS.value: _compile_exists,
+    CriteriumType.PREFIX.value: _compile_prefix,
+}
 
 
 def _get_value(entry, path):
     """
     Gets the [nested] value from a given `entry` under a given `path`.
+    :return: tuple (value, err), where `err` flags a missing path
     """
-    try:
-        value = entry
-        for item in path:
-            value = value[item]
-        return value, None
-    except KeyError:
-        return None, KeyError
+    value = entry
+    for item in path:
+        value = value.get(item, _MISSING)
+        if value is _MISSING:
+            return None, True
+    return value, False
 
 
-def get_filter(criterium):
+def get_compiler(criterium):
     """
-    Returns the filter function based on input type
+    Returns the criterium compiler based on input type
     """
     if criterium is None:
-        return _filter_value
+        return _compile_value
     if isinstance(criterium, (str, int, float, bool)):
-        return _filter_value
+        return _compile_value
     if isinstance(criterium, dict) and len(criterium) == 1:
-        matcher_map = {
-            CriteriumType.ANYTHING_BUT.value: _filter_anything_but,
-            CriteriumType.NUMERIC.value: _filter_numeric,
-            CriteriumType.EXISTS.value: _filter_exists,
-            CriteriumType.PREFIX.value: _filter_prefix,
-        }
-        return matcher_map.get(next(iter(criterium.keys())))
+        return CRITERIUM_COMPILERS.get(next(iter(criterium.keys())))
     return None
 
 
-def check_match(entry, path, criteria):
+def compile_criterium(criterium):
     """
-    Check if value in `entry` under `path` matches any of the supplied `criteria`
+    Compiles a single `criterium` into a `(value, err) -> bool` matcher
     """
-    value, err = _get_value(entry=entry, path=path)
-    for criterium in criteria:
-        matcher = get_filter(criterium=criterium)
-        if matcher(value, criterium, err):
-            return True
-    return False
+    compiler = get_compiler(criterium=criterium)
+    if compiler is None:
+        raise TypeError(f"Unsupported criterium: {criterium}")
+    return compiler(criterium)
+
+
+def compile_match(path, criteria):
+    """
+    Compiles a check if value in `entry` under `path` matches any of the supplied `criteria`
+    """
+    matchers = [compile_criterium(criterium=criterium) for criterium in criteria]
+
+    def _match(entry):
+        value, err = _get_value(entry=entry, path=path)
+        return any(matcher(value, err) for matcher in matchers)
+
+    return _match
+
+
+def flatten_filter(filter_, root=()):
+    """
+    Flattens a (nested) filter dict into a list of (path, criteria) leaves
+    """
+    leaves = []
+    for field, criteria in filter_.items():
+        path = root + (field,)
+        if isinstance(criteria, list):
+            leaves.append((path, criteria))
+        elif isinstance(criteria, dict):
+            leaves.extend(flatten_filter(filter_=criteria, root=path))
+    return leaves
+
+
+def compile_filter(filter_):
+    """
+    Compiles a (nested) filter dict into a single `entry -> bool` predicate,
+    evaluating the fields cheapest-first (shallow paths before deep ones)
+    and stopping at the first non-matching one
+    """
+    leaves = sorted(flatten_filter(filter_=filter_), key=lambda leaf: len(leaf[0]))
+    predicates = [
+        compile_match(path=path, criteria=criteria) for path, criteria in leaves
+    ]
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def _match(entry):
+        return all(predicate(entry) for predicate in predicates)
+
+    return _match
+
+
+def _to_mask(values):
+    """
+    Converts a comparison result into a numpy mask of bool, missing values
+    (`pd.NA`) of nullable dtypes match nothing
+    """
+    if hasattr(values, "to_numpy"):
+        return values.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(values, dtype=bool)
+
+
+def _mask_elementwise(series, predicate):
+    return np.fromiter(
+        (predicate(value) for value in series), dtype=bool, count=len(series)
+    )
+
+
+def _mask_value(series, criterium):
+    if criterium is None:
+        # `None == nan` does not hold for the entries either
+        return _mask_elementwise(series, lambda value: value is None)
+    return series == criterium
+
+
+def _mask_anything_but(series, criterium):
+    reference = criterium[CriteriumType.ANYTHING_BUT.value]
+    if series.dtype == object:
+        # `in` compares by identity first, as for the (unconverted) entries
+        return _mask_elementwise(series, lambda value: value not in reference)
+    mask = ~series.isin(reference)
+    # `isin` matches nan to nan, a converted nan entry is never `in` the reference
+    if any(isinstance(value, float) and np.isnan(value) for value in reference):
+        mask |= series.isna()
+    return mask
+
+
+def _mask_numeric(series, criterium):
+    mask = np.ones(len(series), dtype=bool)
+    for op, ref in pairwise(criterium[CriteriumType.NUMERIC.value]):
+        mask &= _to_mask(NUMERIC_OPERATORS[op](series, ref))
+    return mask
+
+
+def _mask_exists(series, criterium):
+    # a present key exists in every entry, whatever its value
+    exists = compile_criterium(criterium=criterium)(None, False)
+    return np.full(len(series), exists, dtype=bool)
+
+
+def _mask_prefix(series, criterium):
+    reference = criterium[CriteriumType.PREFIX.value]
+    if str(series.dtype).startswith("string"):
+        return series.str.startswith(reference, na=False)
+    if series.dtype.kind in "biufcmM":
+        return np.zeros(len(series), dtype=bool)
+    # object columns may mix strings with other values
+    return _mask_elementwise(
+        series, lambda value: isinstance(value, str) and value.startswith(reference)
+    )
+
+
+CRITERIUM_MASKS = {
+    CriteriumType.ANYTHING_BUT.value: _mask_anything_but,
+    CriteriumType.NUMERIC.value: _mask_numeric,
+    CriteriumType.EXISTS.value: _mask_exists,
+    CriteriumType.PREFIX.value: _mask_prefix,
+}
+
+
+def compile_mask(criterium):
+    """
+    Resolves the vectorized matcher of a given `criterium` once, together with
+    its outcome for a missing column, so `Filter.apply` does no per-call dispatch
+    :return: tuple (masker: callable(series), missing: bool)
+    """
+    if isinstance(criterium, dict):
+        masker = CRITERIUM_MASKS[next(iter(criterium.keys()))]
+    else:
+        masker = _mask_value
+    missing = compile_criterium(criterium=criterium)(None, True)
+    return partial(masker, criterium=criterium), missing
+
+
+def compile_mask_match(path, criteria):
+    """
+    Compiles the vectorized check if column under `path` matches any of the
+    supplied `criteria`. Nested paths are resolved as dot-joined column names
+    (as in `pd.json_normalize`), a missing column is a missing value in every row,
+    a present column `exists` in every row, whatever its null cells, and `pd.NA`
+    cells of nullable dtypes match no value comparison
+    :return: callable(dataframe) -> numpy.ndarray of bool
+    """
+    column = path[0] if len(path) == 1 else ".".join(str(item) for item in path)
+    maskers = [compile_mask(criterium=criterium) for criterium in criteria]
+
+    def _mask(dataframe):
+        mask = np.zeros(dataframe.shape[0], dtype=bool)
+        if column not in dataframe.columns:
+            mask |= any(missing for _, missing in maskers)
+            return mask
+        series = dataframe[column]
+        for masker, _ in maskers:
+            mask |= _to_mask(masker(series))
+        return mask
+
+    return _mask
 
 
 class Filter:
@@ -131,25 +318,36 @@ class Filter:
 
     def __init__(self, filters: list | None) -> None:
         self.filters = filters or []
+        self._compiled = [compile_filter(filter_=filter_) for filter_ in self.filters]
+        self._masks = [
+            [
+                compile_mask_match(path=path, criteria=criteria)
+                for path, criteria in flatten_filter(filter_=filter_)
+            ]
+            for filter_ in self.filters
+        ]
 
     def __call__(self, entry) -> bool:
-        entry = dict(entry)
-        if len(self.filters) == 0:
+        if len(self._compiled) == 0:
             return True
+        if not isinstance(entry, Mapping):
+            entry = dict(entry)
+        return any(match(entry) for match in self._compiled)
+
+    def apply(self, dataframe):
+        """
+        Vectorized filtering of a pandas.DataFrame, one entry per row
+        (see `compile_mask_match` for the column resolution rules)
+        :param dataframe: pandas.DataFrame
+        :return: numpy.ndarray of bool, the row mask of matching entries
+        """
+        if len(self._masks) == 0:
+            return np.ones(dataframe.shape[0], dtype=bool)
 
-        for filter_ in self.filters:
-            result = self._filter(entry=entry, filter_=filter_)
-            if result:
-                return True
-        return False
-
-    def _filter(self, entry, filter_, root=None):
-        root = root or []
-        results = []
-        for field, criteria in filter_.items():
-            path = root + [field]
-            if isinstance(criteria, list):
-                results.append(check_match(entry=entry, path=path, criteria=criteria))
-            elif isinstance(criteria, dict):
-                results.append(self._filter(entry=entry, filter_=criteria, root=path))
-        return all(results)
+        result = np.zeros(dataframe.shape[0], dtype=bool)
+        for masks in self._masks:
+            mask = np.ones(dataframe.shape[0], dtype=bool)
+            for match in masks:
+                mask &= match(dataframe)
+            result |= mask
+        return result
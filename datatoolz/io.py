@@ -3,15 +3,58 @@
 import os
 import io
 import time
+import inspect
 import warnings
+from itertools import chain, count, islice
+from functools import lru_cache, partial
 from uuid import uuid4
+from urllib.parse import quote
 from concurrent.futures import ThreadPoolExecutor
-from gzip import compress, decompress
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
+import pyarrow.dataset as ds
+
+try:
+    from isal.igzip import GzipFile
+    from isal.isal_zlib import ISAL_DEFAULT_COMPRESSION as _GZIP_DEFAULT_LEVEL
+except ImportError:  # pragma: no cover
+    from gzip import GzipFile
+    from zlib import Z_DEFAULT_COMPRESSION as _GZIP_DEFAULT_LEVEL
+
+try:
+    from isal import igzip_threaded
+except ImportError:  # pragma: no cover
+    igzip_threaded = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .filesystem import FileSystem
 
+FILETYPES = ("parquet", "dsv", "tsv", "jsonlines")
+IO_WORKERS = int(os.environ.get("DATATOOLZ_IO_WORKERS", "16"))
+GZIP_COMPRESSLEVEL = int(
+    os.environ.get("DATATOOLZ_GZIP_COMPRESSLEVEL", str(_GZIP_DEFAULT_LEVEL))
+)
+GZIP_THREADS = int(os.environ.get("DATATOOLZ_GZIP_THREADS", "4"))
+GZIP_THREADED_MIN_SIZE = 2 * 1024 * 1024
+PARQUET_BUFFER_SIZE = 256 * 1024
+WRITE_BLOCK_SIZE = 5 * 2**20
+WRITE_SINGLE_PUT_MAX = 5 * 2**30
+# multithreaded dataset writes only keep the row order on request (pyarrow>=15),
+# older releases keep it writing single-threaded
+DATASET_WRITE_ORDER = (
+    {"use_threads": True, "preserve_order": True}
+    if "preserve_order" in inspect.signature(ds.write_dataset).parameters
+    else {"use_threads": False}
+)
+
 
 class DataIO:
     """Class for data writing/reading"""
@@ -33,6 +76,46 @@ class DataIO:
             self.get_path if partition_transformer is None else partition_transformer
         )
 
+    def _is_dataset_write(
+        self, dataframe, filetype, partition_by, suffix, drop_partitions
+    ):
+        """
+        Check if a write can be delegated to the pyarrow dataset writer,
+        i.e. it yields the same hive layout as the `get_partitions` pipeline
+        """
+        return (
+            filetype == "parquet"
+            and bool(partition_by)
+            and drop_partitions
+            and suffix is None
+            and self.partition_transformer is self.get_path
+            and _is_hive_safe(dataframe=dataframe, partition_by=partition_by)
+        )
+
+    def _write_dataset(self, dataframe, path, partition_by):
+        """
+        Writes a hive-partitioned parquet dataset in a single pyarrow call
+        :param dataframe: pandas.DataFrame
+        :param path: path-like, dataset root
+        :param partition_by: list of columns to partition the output
+        """
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        # pyarrow refuses to write more than 1024 partitions by default
+        partition_number = dataframe[partition_by].drop_duplicates().shape[0]
+        ds.write_dataset(
+            table,
+            base_dir=path,
+            basename_template=f"{_unique_name()}-{{i}}",
+            partitioning=ds.HivePartitioning(
+                table.select(partition_by).schema, segment_encoding="none"
+            ),
+            format="parquet",
+            filesystem=self.filesystem,
+            existing_data_behavior="overwrite_or_ignore",
+            max_partitions=max(partition_number, 1024),
+            **DATASET_WRITE_ORDER,
+        )
+
     @staticmethod
     def get_path(prefix="", partitions=None, values=None, suffix=""):
         """
@@ -52,11 +135,9 @@ class DataIO:
                 "and `values` must not contain NoneType"
             )
 
-        return os.path.join(
-            prefix,
-            *(f"{field}={value}" for field, value in zip(partitions, values)),
-            f"{time.time_ns()}-{uuid4()}" if suffix is None else suffix,
-        ).rstrip("/")
+        segments = [f"{field}={value}" for field, value in zip(partitions, values)]
+        segments.append(_unique_name() if suffix is None else suffix)
+        return (_path_root(prefix=prefix) + "/".join(segments)).rstrip("/")
 
     def get_partitions(
         self, dataframe, partition_by=None, prefix="", suffix="", drop=False
@@ -73,78 +154,105 @@ class DataIO:
         if suffix is None or isinstance(suffix, str):
             suffix = [suffix]
         suffix = list(suffix)
+        if self.partition_transformer is self.get_path and None in suffix:
+            fill_suffix = _suffix_factory()
+        else:
+            fill_suffix = _identity
 
         if partition_by is None:
-            chunk_number = len(suffix)
-            chunk_size = -(-dataframe.shape[0] // chunk_number)
-            for i, suf in enumerate(suffix):
-                chunk = dataframe.iloc[chunk_size * i : chunk_size * (i + 1)]
-                chunk_path = self.partition_transformer(prefix=prefix, suffix=suf)
-                yield chunk_path, chunk
+            for suf, chunk in _chunks(dataframe=dataframe, suffix=suffix):
+                yield self.partition_transformer(
+                    prefix=prefix, suffix=fill_suffix(suf)
+                ), chunk
         else:
-            grouper = partition_by[0] if len(partition_by) == 1 else partition_by
-            for group, partition in dataframe.groupby(grouper):
-                if drop:
-                    partition = partition.drop(partition_by, axis=1)
-
-                if not isinstance(group, tuple):
-                    group = (group,)
-
-                chunk_number = len(suffix)
-                chunk_size = -(-partition.shape[0] // chunk_number)
-                for i, suf in enumerate(suffix):
-                    chunk = partition.iloc[chunk_size * i : chunk_size * (i + 1)]
-                    chunk_path = self.partition_transformer(
-                        prefix=prefix, partitions=partition_by, values=group, suffix=suf
-                    )
-                    yield chunk_path, chunk
-
-    def read(self, path, filetype="parquet", gzip=False, **pandas_kwargs):
+            if self.partition_transformer is self.get_path:
+                transform = _path_formatter(prefix=prefix, partitions=partition_by)
+            else:
+                transform = partial(
+                    self.partition_transformer, prefix=prefix, partitions=partition_by
+                )
+            for group, partition in _split_partitions(
+                dataframe=dataframe, partition_by=partition_by, drop=drop
+            ):
+                for suf, chunk in _chunks(dataframe=partition, suffix=suffix):
+                    yield transform(values=group, suffix=fill_suffix(suf)), chunk
+
+    def read(
+        self,
+        path,
+        filetype="parquet",
+        gzip=False,
+        buffer_size=PARQUET_BUFFER_SIZE,
+        pre_buffer=True,
+        **pandas_kwargs,
+    ):
         """
         Function for reading (partitioned) data sets from a given path
         :param path: path-like
         :param filetype: input format type: parquet|dsv|jsonlines
         :param gzip: is the input compressed, only used for dsv|jsonlines
+        :param buffer_size: optional, stream parquet column chunks through buffers
+            of this size instead of loading whole row groups, None to disable
+        :param pre_buffer: bool, coalesce parquet column chunk reads into
+            fewer (range) requests, recommended for remote filesystems
         :param pandas_kwargs: optional kwargs passed to pandas reader
         :return: pandas.DataFrame
         """
 
         warn_tsv_deprecation(filetype=filetype)
+        if filetype not in FILETYPES:
+            raise ValueError(f"Unsupported input format: {filetype}")
+
+        parse = _parser(filetype=filetype, gzip=gzip, pandas_kwargs=pandas_kwargs)
+        dsv_arrow = filetype in ["dsv", "tsv"] and _is_arrow_csv_compatible(
+            pandas_kwargs=pandas_kwargs
+        )
 
         def _deserialize(data):
-            if gzip:
-                data = decompress(data)
-
-            if filetype in ["dsv", "tsv"]:
-                reader = pd.read_csv
-                params = {
-                    "dtype": str,
-                    "keep_default_na": False,
-                    "sep": "\t",
-                    "escapechar": "\\",
-                }
-                params.update(pandas_kwargs)
+            if dsv_arrow:
+                table = _read_csv_arrow(
+                    data=data,
+                    gzip=gzip,
+                    sep=pandas_kwargs.get("sep", "\t"),
+                    header=pandas_kwargs.get("header", "infer"),
+                )
             elif filetype == "jsonlines":
-                reader = pd.read_json
-                params = {"orient": "records", "lines": True, "dtype": False}
+                table = _read_jsonlines_arrow(data=data, gzip=gzip)
             else:
-                raise ValueError(f"Unsupported output format: {filetype}")
-            return reader(io.StringIO(data.decode(encoding="utf-8")), **params)
+                table = None
+            return parse(io.BytesIO(data)) if table is None else table
+
+        filesystem = self.filesystem
 
         def _read(key):
-            if filetype == "parquet":
-                data = pd.read_parquet(path=key, filesystem=self.filesystem)
-            else:
-                with self.filesystem.open(key, mode="rb") as file_object:
-                    data = _deserialize(data=file_object.read())
-            return data
+            with filesystem.open(key, mode="rb") as file_object:
+                if dsv_arrow or filetype == "jsonlines":
+                    return _deserialize(data=file_object.read())
+                # stream straight from the file, no intermediate copy of the payload
+                return parse(file_object)
 
-        with ThreadPoolExecutor() as pool:
-            dfs = list(
-                pool.map(lambda x: _read(key=x), self.filesystem.find(path=path))
-            )
+        if filetype == "parquet":
+            keys = filesystem.find(path=path)
+            if len(keys) == 0:
+                return pd.DataFrame()
+            return _read_parquet(
+                keys=keys,
+                filesystem=filesystem,
+                buffer_size=buffer_size,
+                pre_buffer=pre_buffer,
+            ).reset_index(drop=True)
 
-        return pd.concat(dfs).reset_index(drop=True) if len(dfs) > 0 else pd.DataFrame()
+        # reads are submitted while the listing is still in progress
+        parts = _pool_map(
+            _read, getattr(filesystem, "iter_find", filesystem.find)(path)
+        )
+        if len(parts) == 0:
+            return pd.DataFrame()
+
+        return _concat(
+            parts=parts,
+            range_columns=dsv_arrow and pandas_kwargs.get("header", "infer") is None,
+        )
 
     def write(
         self,
@@ -170,28 +278,36 @@ class DataIO:
         """
 
         warn_tsv_deprecation(filetype=filetype)
+        if filetype not in FILETYPES:
+            raise ValueError(f"Unsupported output format: {filetype}")
 
-        def _serialize(data):
-            if filetype in ["tsv", "dsv"]:
-                params = {"index": False, "sep": "\t"}
-                params.update(pandas_kwargs)
-                data = data.to_csv(**params)
-            elif filetype == "jsonlines":
-                data = data.to_json(orient="records", lines=True)
-            else:
-                raise ValueError(f"Unsupported output format: {filetype}")
-            data = data.encode("utf-8")
-            if gzip:
-                data = compress(data)
-            return data
+        if self._is_dataset_write(
+            dataframe=dataframe,
+            filetype=filetype,
+            partition_by=partition_by,
+            suffix=suffix,
+            drop_partitions=drop_partitions,
+        ):
+            self._write_dataset(
+                dataframe=dataframe, path=path, partition_by=partition_by
+            )
+            return
+
+        filesystem = self.filesystem
+        makedirs = _makedirs_once(makedirs=filesystem.makedirs)
+        serialize = _serializer(
+            filetype=filetype, gzip=gzip, pandas_kwargs=pandas_kwargs
+        )
 
         def _write(key, data):
-            self.filesystem.makedirs(os.path.dirname(key), exist_ok=True)
+            makedirs(os.path.dirname(key))
             if filetype == "parquet":
-                data.to_parquet(path=key, filesystem=self.filesystem)
+                data.to_parquet(path=key, filesystem=filesystem)
             else:
-                data = _serialize(data=data)
-                with self.filesystem.open(key, mode="wb") as file_object:
+                data = serialize(data)
+                with filesystem.open(
+                    key, mode="wb", block_size=_write_block_size(size=len(data))
+                ) as file_object:
                     file_object.write(data)
 
         pipeline = self.get_partitions(
@@ -202,8 +318,575 @@ class DataIO:
             drop=drop_partitions,
         )
 
-        with ThreadPoolExecutor() as pool:
-            list(pool.map(lambda x: _write(key=x[0], data=x[1]), pipeline))
+        _pool_map(lambda x: _write(key=x[0], data=x[1]), pipeline)
+
+
+def _parser(filetype, gzip, pandas_kwargs):
+    """
+    Resolves the pandas reader and its parameters once per read
+    :param filetype: input format type: parquet|dsv|jsonlines
+    :param gzip: bool, is the input compressed
+    :param pandas_kwargs: kwargs passed to pandas reader (dsv only)
+    :return: function(source) -> pandas.DataFrame, None for parquet
+    """
+    if filetype in ["dsv", "tsv"]:
+        params = {
+            "dtype": str,
+            "keep_default_na": False,
+            "sep": "\t",
+            "escapechar": "\\",
+            "encoding": "utf-8",
+        }
+        params.update(pandas_kwargs)
+        reader = partial(pd.read_csv, **params)
+    elif filetype == "jsonlines":
+        reader = partial(
+            pd.read_json, orient="records", lines=True, dtype=False, encoding="utf-8"
+        )
+    else:
+        return None
+    return partial(_parse, reader=reader, gzip=gzip)
+
+
+def _parse(source, reader, gzip):
+    """
+    Parses dsv|jsonlines with pandas
+    :param source: binary file-like object
+    :param reader: function(source) -> pandas.DataFrame
+    :param gzip: bool, is the input compressed
+    :return: pandas.DataFrame
+    """
+    if gzip:
+        source = GzipFile(fileobj=source)
+    return reader(source)
+
+
+def _serializer(filetype, gzip, pandas_kwargs):
+    """
+    Resolves the serializer and its parameters once per write
+    :param filetype: output format: parquet|dsv|jsonlines
+    :param gzip: bool, should the output be gzipped (dsv|jsonlines only)
+    :param pandas_kwargs: kwargs passed to pandas writer (dsv only)
+    :return: function(dataframe) -> bytes, None for parquet
+    """
+    if filetype == "parquet":
+        return None
+    if filetype in ["tsv", "dsv"]:
+        params = {"index": False, "sep": "\t", "encoding": "utf-8"}
+        params.update(pandas_kwargs)
+        return partial(
+            _serialize,
+            encode=partial(_write_csv_arrow, pandas_kwargs=pandas_kwargs),
+            writer="to_csv",
+            params=params,
+            gzip=gzip,
+        )
+    return partial(
+        _serialize,
+        encode=_write_jsonlines_orjson,
+        writer="to_json",
+        params={"orient": "records", "lines": True},
+        gzip=gzip,
+    )
+
+
+def _serialize(dataframe, encode, writer, params, gzip):
+    """
+    Serializes dataframe into dsv|jsonlines file content
+    :param dataframe: pandas.DataFrame
+    :param encode: function(dataframe) -> bytes, fast path returning None
+        when not applicable
+    :param writer: name of the pandas writer method used as a fallback
+    :param params: kwargs passed to pandas writer
+    :param gzip: bool, should the output be gzipped
+    :return: bytes
+    """
+    data = encode(dataframe)
+    if data is not None:
+        return _compress(data=data) if gzip else data
+
+    buffer = io.BytesIO()
+    if gzip:
+        size = dataframe.memory_usage(index=False).sum()
+        with _gzip_writer(buffer=buffer, size=size) as file_object:
+            getattr(dataframe, writer)(file_object, **params)
+    else:
+        getattr(dataframe, writer)(buffer, **params)
+    return buffer.getvalue()
+
+
+def _gzip_writer(buffer, size):
+    """
+    Gzip writer into `buffer`, compressing blocks on multiple threads (still a
+    single standard gzip stream) when isal is available and the payload is large
+    :param buffer: binary file-like object
+    :param size: int, (estimated) uncompressed payload size in bytes
+    :return: writable binary file-like object
+    """
+    if (
+        igzip_threaded is not None
+        and GZIP_THREADS > 1
+        and size >= GZIP_THREADED_MIN_SIZE
+    ):
+        return igzip_threaded.open(
+            buffer, mode="wb", compresslevel=GZIP_COMPRESSLEVEL, threads=GZIP_THREADS
+        )
+    return GzipFile(fileobj=buffer, mode="wb", compresslevel=GZIP_COMPRESSLEVEL)
+
+
+def _compress(data):
+    """
+    Gzip-compresses `data` bytes
+    """
+    buffer = io.BytesIO()
+    with _gzip_writer(buffer=buffer, size=len(data)) as file_object:
+        file_object.write(data)
+    return buffer.getvalue()
+
+
+def _write_block_size(size):
+    """
+    Write block size fitting a payload of `size` bytes in a single block, so that
+    object stores (s3fs) upload it in one PUT instead of a multipart upload
+    (up to the 5 GiB single PUT limit, local filesystems ignore it)
+    :param size: int, payload size in bytes
+    :return: int, block size in bytes
+    """
+    if size >= WRITE_SINGLE_PUT_MAX:
+        return WRITE_BLOCK_SIZE
+    return max(WRITE_BLOCK_SIZE, size + 1)
+
+
+def _makedirs_once(makedirs):
+    """
+    `makedirs(path, exist_ok=True)` skipping directories already created through
+    it - many files of a single write call share a few partition directories
+    :param makedirs: filesystem `makedirs` method
+    :return: callable(path)
+    """
+    created = set()
+
+    def _makedirs(path):
+        if path not in created:
+            makedirs(path, exist_ok=True)
+            created.add(path)
+
+    return _makedirs
+
+
+@lru_cache(maxsize=1)
+def _io_pool():
+    """
+    The IO thread pool shared across DataIO calls, created on first use
+    """
+    return ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="datatoolz-io")
+
+
+if hasattr(os, "register_at_fork"):
+    # a forked child inherits the pool but not its worker threads, tasks
+    # submitted to it would never run - the child creates its own pool instead
+    os.register_at_fork(after_in_child=_io_pool.cache_clear)
+
+
+def _pool_map(func, items):
+    """
+    Maps `func` over `items` on the shared IO pool, submitting tasks as soon as
+    the (lazy) `items` are produced - a single item is processed in the calling
+    thread as there is nothing to overlap
+    :return: list of results
+    """
+    items = iter(items)
+    head = list(islice(items, 2))
+    if len(head) < 2:
+        return [func(item) for item in head]
+    pool = _io_pool()
+    futures = [pool.submit(func, item) for item in chain(head, items)]
+    return [future.result() for future in futures]
+
+
+def _chunks(dataframe, suffix):
+    """
+    Splits dataframe into `len(suffix)` (nearly) equal row chunks
+    :return: generator of (suffix, chunk: pandas.DataFrame)
+    """
+    chunk_size = -(-dataframe.shape[0] // len(suffix))
+    for i, suf in enumerate(suffix):
+        yield suf, dataframe.iloc[chunk_size * i : chunk_size * (i + 1)]
+
+
+def _path_root(prefix):
+    """
+    `prefix` as the head of a "/"-separated path (object-store paths are
+    always "/"-separated, regardless of the OS)
+    """
+    if not prefix or prefix.endswith("/"):
+        return prefix
+    return f"{prefix}/"
+
+
+def _path_formatter(prefix, partitions):
+    """
+    `DataIO.get_path` precomputed for a fixed `prefix` and `partitions`, values
+    are not validated as they come from `_split_partitions` (non-null)
+    :param prefix: path prefix
+    :param partitions: list-like - partitioning fields
+    :return: callable(values, suffix) -> path-like
+    """
+    root = _path_root(prefix=prefix)
+    template = "/".join(
+        str(field).replace("{", "{{").replace("}", "}}") + "={}" for field in partitions
+    )
+
+    def _format(values, suffix):
+        return f"{root}{template.format(*values)}/{suffix}".rstrip("/")
+
+    return _format
+
+
+def _identity(value):
+    return value
+
+
+def _unique_name():
+    """
+    Time-ordered unique file name - a fresh uuid4 per call is deliberate, a
+    process-level random prefix would be shared by forked workers
+    """
+    return f"{time.time_ns()}-{uuid4()}"
+
+
+def _suffix_factory():
+    """
+    Unique file names for a single write call - one time_ns + uuid4 base
+    numbered per file, instead of a fresh pair for every partition file
+    :return: callable replacing `None` suffixes, other suffixes are passed through
+    """
+    base_suffix, number = _unique_name(), count()
+    return lambda suffix: f"{base_suffix}-{next(number)}" if suffix is None else suffix
+
+
+def _read_parquet(keys, filesystem, buffer_size, pre_buffer):
+    """
+    Reads parquet files into a single pandas.DataFrame with pyarrow.dataset
+    :param keys: list of file paths
+    :param filesystem: fsspec-compatible filesystem
+    :param buffer_size: buffered stream size, None to load whole row groups
+    :param pre_buffer: bool, coalesce column chunk reads
+    :return: pandas.DataFrame
+    """
+    parquet_format = ds.ParquetFileFormat(
+        default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+            use_buffered_stream=buffer_size is not None,
+            buffer_size=buffer_size or PARQUET_BUFFER_SIZE,
+            pre_buffer=pre_buffer,
+        )
+    )
+    dataset = ds.dataset(keys, filesystem=filesystem, format=parquet_format)
+    fragments = list(dataset.get_fragments())
+    schema = fragments[0].physical_schema
+    if any(not fragment.physical_schema.equals(schema) for fragment in fragments):
+        # the dataset schema comes from the first file only, columns missing
+        # there would be dropped and types are not promoted - convert per file
+        # and let pandas align (and upcast) the columns instead
+        return pd.concat(
+            [
+                _table_to_pandas(fragment.to_table(use_threads=True))
+                for fragment in fragments
+            ]
+        )
+    return _table_to_pandas(dataset.to_table(use_threads=True))
+
+
+def _table_to_pandas(table):
+    """
+    Converts a pyarrow.Table to pandas, columns are released as they are
+    converted instead of the table and the dataframe being held in memory
+    at the same time
+    """
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _partition_order(dataframe, partition_by):
+    """
+    Orders the rows with non-null partition values by partition
+    (stable, so rows keep their relative order within a partition)
+    :param dataframe: pandas.DataFrame
+    :param partition_by: list of columns to partition by
+    :return: tuple (rows, starts, stops) - ordered row positions and partition bounds
+    """
+    rows = np.flatnonzero(dataframe[partition_by].notna().all(axis=1).to_numpy())
+    codes = np.column_stack(
+        [pd.factorize(dataframe[field], sort=True)[0][rows] for field in partition_by]
+    )
+    order = np.lexsort(codes.T[::-1])
+    codes, rows = codes[order], rows[order]
+    boundaries = np.flatnonzero((np.diff(codes, axis=0) != 0).any(axis=1)) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [rows.shape[0]]))
+    return rows, starts, stops
+
+
+def _split_partitions(dataframe, partition_by, drop=False):
+    """
+    Splits dataframe into contiguous slices of equal partition values
+    (gathered once in partition order, instead of materializing a groupby)
+    :param dataframe: pandas.DataFrame
+    :param partition_by: list of columns to partition by
+    :param drop: bool, should the partition fields be dropped from the output
+    :return: generator of (partition_values: tuple, partition_data: pandas.DataFrame)
+    """
+    if not dataframe[partition_by].notna().all(axis=1).any():
+        return
+
+    rows, starts, stops = _partition_order(
+        dataframe=dataframe, partition_by=partition_by
+    )
+    groups = (
+        dataframe[partition_by].iloc[rows[starts]].itertuples(index=False, name=None)
+    )
+    # a single copy, gathering rows and dropping fields at once
+    if drop:
+        partitioned = dataframe.iloc[
+            rows, np.flatnonzero(~dataframe.columns.isin(partition_by))
+        ]
+    elif rows.shape[0] == dataframe.shape[0] and (np.diff(rows) > 0).all():
+        partitioned = dataframe
+    else:
+        partitioned = dataframe.iloc[rows]
+
+    for group, start, stop in zip(groups, starts, stops):
+        yield group, partitioned.iloc[start:stop]
+
+
+def _is_arrow_csv_compatible(pandas_kwargs):
+    """
+    Check if a dsv read can be done by pyarrow with the same result as
+    pandas - only `sep` (single character) and `header` (0|None) are supported
+    """
+    sep = pandas_kwargs.get("sep", "\t")
+    header = pandas_kwargs.get("header", "infer")
+    return (
+        set(pandas_kwargs) <= {"sep", "header"}
+        and isinstance(sep, str)
+        and len(sep) == 1
+        and (header is None or (header in ("infer", 0) and header is not False))
+    )
+
+
+def _write_csv_arrow(dataframe, pandas_kwargs):
+    """
+    Multithreaded pyarrow dsv writer, mirroring `dataframe.to_csv(index=False)`.
+    Only `sep` (single character) and `header` (bool) are supported, for frames
+    of (unique) string-named integer and non-null string columns
+    :param dataframe: pandas.DataFrame
+    :param pandas_kwargs: kwargs meant for the pandas writer
+    :return: bytes, or None if the output could differ from pandas
+    """
+    sep = pandas_kwargs.get("sep", "\t")
+    if not (
+        set(pandas_kwargs) <= {"sep", "header"}
+        and isinstance(sep, str)
+        and len(sep) == 1
+        and isinstance(pandas_kwargs.get("header", True), (bool, type(None)))
+    ):
+        return None
+    # the csv module quotes an empty field when it is the only one in a row
+    if dataframe.shape[1] < 2 or not dataframe.columns.is_unique or os.linesep != "\n":
+        return None
+
+    structural = (sep, '"', "\r", "\n")
+    for name, column in dataframe.items():
+        if not isinstance(name, str) or any(char in name for char in structural):
+            return None
+        if column.dtype.kind in "iu":
+            continue
+        if pd.api.types.infer_dtype(column, skipna=False) != "string":
+            return None
+
+    sink = pa.BufferOutputStream()
+    try:
+        # values which pandas would quote are refused with quoting_style="none"
+        pa_csv.write_csv(
+            pa.Table.from_pandas(dataframe, preserve_index=False),
+            sink,
+            write_options=pa_csv.WriteOptions(
+                include_header=False, delimiter=sep, quoting_style="none"
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    data = sink.getvalue().to_pybytes()
+    if pandas_kwargs.get("header", True):
+        data = (sep.join(dataframe.columns) + "\n").encode("utf-8") + data
+    return data
+
+
+def _write_jsonlines_orjson(dataframe):
+    """
+    orjson jsonlines writer, equivalent to `to_json(orient="records", lines=True)`
+    (modulo string escaping) for frames of (unique) string-named integer, bool
+    and string columns
+    :param dataframe: pandas.DataFrame
+    :return: bytes, or None if orjson is not installed or the output could differ
+    """
+    if orjson is None or dataframe.shape[0] == 0 or not dataframe.columns.is_unique:
+        return None
+    for name, column in dataframe.items():
+        if not isinstance(name, str):
+            return None
+        if column.dtype.kind in "iub":
+            continue
+        if pd.api.types.infer_dtype(column, skipna=True) != "string":
+            return None
+
+    dumps, option = orjson.dumps, orjson.OPT_APPEND_NEWLINE
+    return b"".join(
+        dumps(record, option=option) for record in dataframe.to_dict(orient="records")
+    )
+
+
+def _read_csv_arrow(data, gzip, sep, header):
+    """
+    Multithreaded pyarrow dsv reader, mirroring
+    `pd.read_csv(dtype=str, keep_default_na=False, escapechar="\\")`
+    :param data: bytes, raw file content
+    :param gzip: bool, is the content gzip-compressed
+    :param sep: str, single character delimiter
+    :param header: 0|"infer" for a header row, None for no header
+    :return: pyarrow.Table of string columns, or None if the result could
+        differ from pandas (e.g. ragged rows, duplicate or empty column names)
+    """
+
+    def _stream():
+        return pa.input_stream(pa.py_buffer(data), compression="gzip" if gzip else None)
+
+    read_options = pa_csv.ReadOptions(autogenerate_column_names=header is None)
+    parse_options = pa_csv.ParseOptions(
+        delimiter=sep, escape_char="\\", newlines_in_values=True
+    )
+
+    try:
+        # column names are needed up front to disable type inference
+        with pa_csv.open_csv(
+            _stream(), read_options=read_options, parse_options=parse_options
+        ) as reader:
+            names = reader.schema.names
+        # pandas de-duplicates repeated names ("a", "a.1") and names empty
+        # ones "Unnamed: n" (e.g. the index column of `to_csv`)
+        if len(set(names)) != len(names) or "" in names:
+            return None
+        return pa_csv.read_csv(
+            _stream(),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # e.g. rows with missing or extra fields, which pandas pads or indexes
+        return None
+
+
+def _read_jsonlines_arrow(data, gzip):
+    """
+    Multithreaded pyarrow jsonlines reader, mirroring
+    `pd.read_json(orient="records", lines=True, dtype=False)` for flat records
+    of integer, float and (non-null) string and bool values - except that floats
+    are parsed correctly rounded (as `float()`), where pandas' default parser may
+    be off in the last digit and reads subnormals (e.g. `5e-324`) as 0
+    :param data: bytes, raw file content
+    :param gzip: bool, is the content gzip-compressed
+    :return: pyarrow.Table, or None if the result could differ from pandas
+    """
+    stream = pa.input_stream(pa.py_buffer(data), compression="gzip" if gzip else None)
+    try:
+        table = pa_json.read_json(stream)
+    except pa.ArrowInvalid:
+        return None
+
+    for field, column in zip(table.schema, table.columns):
+        name = field.name.lower()
+        # pandas parses these columns as dates
+        if (
+            name.endswith(("_at", "_time"))
+            or name.startswith("timestamp")
+            or name in ("modified", "date", "datetime")
+        ):
+            return None
+        if pa.types.is_floating(field.type):
+            # integers beyond int64 are read as floats, pandas keeps them as uint64
+            if np.nanmax(np.abs(column.to_numpy()), initial=0) >= 2**63:
+                return None
+            continue
+        if pa.types.is_integer(field.type):
+            continue
+        # pandas fills missing non-numeric values with NaN, pyarrow with None
+        if not (pa.types.is_string(field.type) or pa.types.is_boolean(field.type)):
+            return None
+        if column.null_count > 0:
+            return None
+    return table
+
+
+def _concat(parts, range_columns=False):
+    """
+    Concatenates per-file results into a single pandas.DataFrame -
+    pyarrow tables sharing a schema are concatenated without copying
+    and converted once, columns released as they are converted
+    :param parts: list of pandas.DataFrame|pyarrow.Table
+    :param range_columns: bool, name the columns 0..n (header-less dsv)
+    :return: pandas.DataFrame
+    """
+    if all(isinstance(part, pa.Table) for part in parts) and all(
+        part.schema.equals(parts[0].schema) for part in parts
+    ):
+        table = pa.concat_tables(parts)
+        del parts[:]
+        dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+    else:
+        dataframe = pd.concat(
+            [_part_to_pandas(part=part, range_columns=range_columns) for part in parts],
+            ignore_index=True,
+        )
+
+    if range_columns:
+        dataframe.columns = range(dataframe.shape[1])
+    return dataframe
+
+
+def _part_to_pandas(part, range_columns):
+    """
+    Converts a per-file pyarrow.Table to pandas, header-less dsv columns are
+    named 0..n as by the pandas reader (pyarrow generates "f0".."fn")
+    """
+    if not isinstance(part, pa.Table):
+        return part
+    dataframe = part.to_pandas()
+    if range_columns:
+        dataframe.columns = range(dataframe.shape[1])
+    return dataframe
+
+
+def _is_hive_safe(dataframe, partition_by):
+    """
+    Check if partition values render the same in pyarrow's hive partitioning
+    (which URI-escapes segments) as in `DataIO.get_path`
+    """
+    partitions = dataframe[partition_by]
+    if partitions.isna().any().any():
+        return False
+    for field in partition_by:
+        if pd.api.types.is_integer_dtype(partitions[field]):
+            continue
+        if not pd.api.types.is_string_dtype(partitions[field]):
+            return False
+        if any(value != quote(value) for value in partitions[field].unique()):
+            return False
+    return True
 
 
 def warn_tsv_deprecation(filetype):
@@ -216,4 +899,5 @@ def warn_tsv_deprecation(filetype):
             'Please use the new "dsv" (delimiter-separated values) '
             "type with 'sep=\\t'",
             DeprecationWarning,
+            stacklevel=3,
         )
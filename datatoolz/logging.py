@@ -1,35 +1,110 @@
 """Module allows publishing json-structured log messages"""
 
+import os
 import sys
-import datetime
 import json
 import logging
 import time
 import tracemalloc
+from functools import lru_cache, wraps
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 INFO = "info"
 DEBUG = "debug"
 WARNING = "warning"
 ERROR = "error"
+LEVELS = frozenset((INFO, WARNING, DEBUG, ERROR))
+LOG_FLUSH_RECORDS = int(os.environ.get("DATATOOLZ_LOG_FLUSH_RECORDS", "1"))
+
+
+class _MessageFormatter(logging.Formatter):
+    """Formatter passing the already serialized json message through as-is"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return record.getMessage()
+
+
+class _BatchStreamHandler(logging.StreamHandler):
+    """
+    Stream handler flushing the stream every `capacity` records instead of
+    after each one, errors are flushed immediately
+    """
+
+    def __init__(self, stream, capacity: int) -> None:
+        super().__init__(stream)
+        self.capacity = capacity
+        self.pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self.pending += 1
+            if self.pending >= self.capacity or record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.pending = 0
+        super().flush()
+
+    def close(self) -> None:
+        if self.pending and not getattr(self.stream, "closed", False):
+            self.flush()
+        super().close()
 
 
 class JsonLogger:
     """A wrapper on the logging module to produce JSON-structured logs"""
 
-    def __init__(self, name: str = None, env: str = None) -> None:
+    def __init__(
+        self,
+        name: str = None,
+        env: str = None,
+        iso_timestamps: bool = True,
+        flush_records: int = LOG_FLUSH_RECORDS,
+    ) -> None:
+        """
+        JsonLogger initializer
+        :param name: optional str, application (logger) name
+        :param env: optional str, environment name
+        :param iso_timestamps: log an ISO formatted UTC "timestamp",
+          otherwise integer epoch nanoseconds as "ts_ns"
+        :param flush_records: flush stdout every n records (errors immediately),
+          pending records are flushed at interpreter exit
+        """
         self.name = name
         self.env = env
+        self.iso_timestamps = iso_timestamps
+        # static part of every message, serialized once as an unclosed json object
+        self._prefix = (
+            _dumps({"logger": {"application": name, "environment": env}})[:-1] + ","
+        )
         if name:
             _logger = logging.getLogger(name)
         else:
             _logger = logging.getLogger()
 
-        for handler in _logger.handlers:
+        for handler in list(_logger.handlers):
             _logger.removeHandler(handler)
+            # handlers attached by others may be shared, only ours are closed
+            if isinstance(handler.formatter, _MessageFormatter):
+                handler.close()
 
-        handler = logging.StreamHandler(sys.stdout)
-        fmt = "%(message)s"
-        handler.setFormatter(logging.Formatter(fmt))
+        if flush_records > 1:
+            handler = _BatchStreamHandler(sys.stdout, capacity=flush_records)
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_MessageFormatter())
         _logger.addHandler(handler)
 
         _logger.setLevel(logging.INFO)
@@ -37,16 +112,16 @@ class JsonLogger:
         self.logger = _logger
 
     def _log(self, msg: str, level: str, extra=None) -> str:
-        assert level in (INFO, WARNING, DEBUG, ERROR)
-        j = {
-            "logger": {"application": self.name, "environment": self.env},
-            "level": level,
-            "timestamp": datetime.datetime.utcnow().isoformat(sep=" "),
-            "message": msg,
-        }
-        if extra is not None and len(extra) > 0:
+        assert level in LEVELS
+        j = {"level": level}
+        if self.iso_timestamps:
+            j["timestamp"] = _utc_timestamp()
+        else:
+            j["ts_ns"] = time.time_ns()
+        j["message"] = msg
+        if extra:
             j["extra"] = extra
-        return json.dumps(j)
+        return self._prefix + _dumps(j)[1:]
 
     def info(self, msg: str, **custom) -> None:
         """
@@ -54,7 +129,8 @@ class JsonLogger:
         :param msg: main log message
         :param custom: any optional data to be added to the log structure
         """
-        self.logger.info(msg=self._log(msg=msg, level=INFO, extra=custom))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(msg=self._log(msg=msg, level=INFO, extra=custom))
 
     def error(self, msg, **custom) -> None:
         """
@@ -62,44 +138,97 @@ class JsonLogger:
         :param msg: main log message
         :param custom: any optional data to be added to the log structure
         """
-        self.logger.error(msg=self._log(msg=msg, level=ERROR, extra=custom))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(msg=self._log(msg=msg, level=ERROR, extra=custom))
 
-    def decorate(self, msg: str, duration: bool = True, memory: bool = True, **custom):
+    def decorate(self, msg: str, duration: bool = True, memory=True, **custom):
         """
         A JsonLogger decorator for logging various execution metrics of a function
         :param msg: static log message
         :param duration: log execution duration
-        :param memory: log memory consumption
+        :param memory: log memory consumption: True for the process RSS delta and
+          peak (kB), "tracemalloc" for (slow) traced python allocations
         :param custom: pass any custom value to log, this can be either a static value
           or a callable executed on the function result
         """
 
+        traced = memory == "tracemalloc" or (memory and resource is None)
+        static = {name: value for name, value in custom.items() if not callable(value)}
+        calls = [(name, value) for name, value in custom.items() if callable(value)]
+
         def inner_decorator(func):
+            function_name = func.__name__
+
+            @wraps(func)
             def wrapper(*args, **kwargs):
-                log = {"function": func.__name__}
+                log = {"function": function_name}
 
-                if memory:
+                rss = _max_rss() if memory and not traced else None
+                if traced:
+                    started = not tracemalloc.is_tracing()
                     tracemalloc.start()
-                start = time.perf_counter()
-                result = func(*args, **kwargs)
-                end = time.perf_counter()
-
-                if memory:
-                    log["memory"] = dict(
-                        zip(("current", "peak"), tracemalloc.get_traced_memory())
-                    )
+                start = time.perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    end = time.perf_counter_ns()
+                    if traced:
+                        log["memory"] = dict(
+                            zip(("current", "peak"), tracemalloc.get_traced_memory())
+                        )
+                        # do not leave the allocation hooks attached after the call
+                        if started:
+                            tracemalloc.stop()
+
+                if rss is not None:
+                    peak = _max_rss()
+                    log["memory"] = {"rss_delta_kb": peak - rss, "rss_peak_kb": peak}
 
                 if duration:
-                    log["duration"] = end - start
+                    log["duration"] = (end - start) / 1e9
 
-                for name, call_or_value in custom.items():
-                    if callable(call_or_value):
-                        log[name] = call_or_value(result)
-                    else:
-                        log[name] = call_or_value
+                log.update(static)
+                for name, call in calls:
+                    log[name] = call(result)
                 self.info(msg=msg, **log)
                 return result
 
             return wrapper
 
         return inner_decorator
+
+
+def _dumps(obj) -> str:
+    """
+    Compact json serialization, with orjson when available - values orjson
+    rejects (e.g. integers beyond 64 bits) fall back to json, so the output
+    and errors do not depend on orjson being installed
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _max_rss() -> int:
+    """
+    Peak resident set size of the process in kB
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+@lru_cache(maxsize=1)
+def _utc_second(second: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(second))
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time formatted as `datetime.utcnow().isoformat(sep=" ")`
+    (always with microseconds), the date-time part is formatted once per second
+    """
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_utc_second(second)}.{nanos // 1000:06d}"
@@ -18,4 +18,5 @@ setuptools.setup(
     classifiers=["Programming Language :: Python :: 3"],
     python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={"isal": ["isal"], "orjson": ["orjson"]},
 )
@@ -3,26 +3,38 @@ import unittest
 import shutil
 import tempfile
 import datetime
+from unittest import mock
 
 import boto3
 import pytest
 from moto import mock_s3, mock_sts
 
 
-@mock_s3
-@mock_sts
 class TestFileSystem(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # the mocked services are started once, each test gets its own bucket
+        cls.mocks = [mock_s3(), mock_sts()]
+        for mocked in cls.mocks:
+            mocked.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for mocked in reversed(cls.mocks):
+            mocked.stop()
+
     def setUp(self):
         # Create a temporary directory
         self.test_dir = tempfile.mkdtemp()
 
-        self.bucket_name = "test_bucket"
+        self.bucket_name = f"test_bucket_{self._testMethodName}"
         s3 = boto3.client("s3")
         s3.create_bucket(Bucket=self.bucket_name)
 
         self.basic_params = [
             ("local", self.test_dir),
             ("s3", f"s3://{self.bucket_name}"),
+            ("memory", f"memory://{os.path.basename(self.test_dir)}"),
         ]
 
     def tearDown(self):
@@ -57,6 +69,147 @@ class TestFileSystem(unittest.TestCase):
             result = list(fs.find(path=os.path.join(self.bucket_name, "with-assume")))
             assert [file_name] == result
 
+    def test_s3_filesystem_reuse(self):
+        from datatoolz.filesystem import FileSystem
+
+        role = "arn:some:random:long:enough:string"
+        fs1 = FileSystem(name="s3", assumed_role=role, endpoint_url=None)
+        fs2 = FileSystem(name="s3", assumed_role=[role])
+        assert fs1.filesystem is fs2.filesystem
+
+        fs3 = FileSystem(name="s3")
+        assert fs1.filesystem is not fs3.filesystem
+
+        with mock.patch.dict(os.environ, {"AWS_ACCESS_KEY_ID": "other-key"}):
+            fs4 = FileSystem(name="s3")
+        assert fs3.filesystem is not fs4.filesystem
+
+    def test_s3_filesystem_credential_rotation(self):
+        from datatoolz.filesystem import FileSystem
+
+        with mock.patch.dict(os.environ, {"AWS_SESSION_TOKEN": "token-1"}):
+            fs1 = FileSystem(name="s3")
+            fs2 = FileSystem(name="s3")
+        with mock.patch.dict(os.environ, {"AWS_SESSION_TOKEN": "token-2"}):
+            fs3 = FileSystem(name="s3")
+        assert fs1.filesystem is fs2.filesystem
+        assert fs1.filesystem is not fs3.filesystem
+
+        credentials = os.path.join(self.test_dir, "credentials")
+        with mock.patch.dict(os.environ, {"AWS_SHARED_CREDENTIALS_FILE": credentials}):
+            with open(credentials, "w") as fo:
+                fo.write("[default]\n")
+            fs4 = FileSystem(name="s3")
+            os.utime(credentials, ns=(0, 0))
+            fs5 = FileSystem(name="s3")
+        assert fs4.filesystem is not fs5.filesystem
+
+    def test_s3_lazy_filesystem(self):
+        from datatoolz.filesystem import FileSystem
+
+        with mock.patch("datatoolz.filesystem._get_s3_filesystem") as factory:
+            fs = FileSystem(
+                name="s3", assumed_role="arn:some:random:long:enough:string"
+            )
+            factory.assert_not_called()
+            assert fs.filesystem is fs.filesystem
+        factory.assert_called_once()
+
+    def test_s3_find(self):
+        from datatoolz.filesystem import FileSystem
+
+        fs = FileSystem(name="s3")
+        keys = ["data", "data-sibling", "data/a=1/x", "data/a=2/y", "data0", "other/z"]
+        for key in keys:
+            fs.pipe(f"{self.bucket_name}/{key}", b"")
+
+        for path in (f"s3://{self.bucket_name}/data", f"{self.bucket_name}/data/"):
+            assert fs.find(path) == [
+                f"{self.bucket_name}/data/a=1/x",
+                f"{self.bucket_name}/data/a=2/y",
+            ]
+        path = f"{self.bucket_name}/data-sibling"
+        assert fs.find(path) == [path]
+        assert fs.find(f"{self.bucket_name}/missing") == []
+        assert fs.find(self.bucket_name) == sorted(
+            f"{self.bucket_name}/{key}" for key in keys
+        )
+
+    def test_s3_find_async_filesystem(self):
+        from datatoolz.filesystem import FileSystem
+
+        fs = FileSystem(name="s3")
+        keys = ["data/a=1/x", "data/a=2/y", "other/z"]
+        for key in keys:
+            fs.pipe(f"{self.bucket_name}/{key}", b"")
+
+        # async s3fs has no sync client internals, `find` is delegated to
+        path = f"{self.bucket_name}/data"
+        with mock.patch.object(
+            fs.filesystem, "async_impl", True, create=True
+        ), mock.patch.object(fs.filesystem, "find", wraps=fs.filesystem.find) as find:
+            assert list(fs.iter_find(path)) == [
+                f"{self.bucket_name}/data/a=1/x",
+                f"{self.bucket_name}/data/a=2/y",
+            ]
+        find.assert_called_once_with(path)
+
+    def test_local_find(self):
+        from datatoolz.filesystem import FileSystem
+
+        fs = FileSystem(name="local")
+        root = os.path.join(self.test_dir, "find")
+        keys = ["data-sibling", "data/a=1/x", "data/a=2/y", "data/a=1-b", "data0/z"]
+        for key in keys:
+            fs.makedirs(os.path.dirname(os.path.join(root, key)), exist_ok=True)
+            fs.pipe(os.path.join(root, key), b"")
+        os.makedirs(os.path.join(root, "empty"))
+
+        for path in (root, f"file://{root}", os.path.join(root, "data")):
+            assert fs.find(path) == fs.filesystem.find(path)
+            for maxdepth in (1, 2):
+                assert fs.find(path, maxdepth=maxdepth) == fs.filesystem.find(
+                    path, maxdepth=maxdepth
+                )
+        path = os.path.join(root, "data-sibling")
+        assert fs.find(path) == fs.filesystem.find(path) == [path]
+        assert fs.find(os.path.join(root, "missing")) == []
+
+        # iter_find yields before the whole tree is walked
+        files = fs.iter_find(root)
+        assert next(files) == fs.find(root)[0]
+        assert [next(files)] + list(files) == fs.find(root)[1:]
+
+    def test_filesystem_delegation(self):
+        from datatoolz.filesystem import FileSystem
+
+        fs = FileSystem(name="local")
+        # inherited AbstractFileSystem methods are forwarded to the wrapped filesystem
+        assert fs.exists.__self__ is fs.filesystem
+        assert fs.protocol == fs.filesystem.protocol
+        # explicit wrapper methods take precedence
+        assert fs.ls.__self__ is fs
+        with pytest.raises(AttributeError):
+            fs.no_such_attribute
+        # class-level access gets the inherited callables
+        assert FileSystem._strip_protocol("some/path/") == "some/path"
+        assert callable(FileSystem.from_json)
+        assert FileSystem.protocol == "abstract"
+
+    def test_filesystem_creation_error(self):
+        from datatoolz.filesystem import FileSystem
+
+        with mock.patch(
+            "datatoolz.filesystem._get_s3_filesystem",
+            side_effect=AttributeError("broken"),
+        ):
+            fs = FileSystem(name="s3")
+            # not hidden by `__getattr__` as a missing attribute
+            with pytest.raises(RuntimeError, match="broken"):
+                fs.exists("some/path")
+            with pytest.raises(RuntimeError, match="broken"):
+                fs.no_such_attribute
+
     def test_filesystem_basics(self):
         from datatoolz.filesystem import FileSystem
 
@@ -109,6 +262,16 @@ class TestFileSystem(unittest.TestCase):
                     with pytest.raises(NotImplementedError):
                         fs.sign(path=path1)
 
+                elif filesystem == "memory":
+                    created = fs.created(path=path1)
+                    assert isinstance(created, datetime.datetime)
+
+                    mod = fs.modified(path=path1)
+                    assert isinstance(mod, datetime.datetime)
+
+                    with pytest.raises(NotImplementedError):
+                        fs.sign(path=path1)
+
                 else:
                     raise ValueError(f"Unknown FS: {filesystem}")
 
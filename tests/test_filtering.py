@@ -1,3 +1,7 @@
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from datatoolz.filtering import Filter
@@ -88,9 +92,8 @@ def test_filter_anything_but():
 
 
 def test_filter_anything_but_with_error():
-    filter = Filter(filters=[{"field": [{"anything-but": "invalid-reference"}]}])
     with pytest.raises(ValueError):
-        filter(entry={"field": "a"})
+        Filter(filters=[{"field": [{"anything-but": "invalid-reference"}]}])
 
 
 def test_filter_numeric():
@@ -116,15 +119,19 @@ def test_filter_numeric():
     for entry, exp in zip(entries, expected):
         assert filter(entry=entry) is exp
 
+    filter = Filter(filters=[{"field": [{"numeric": [">", 0, "<", 2, "=", 1]}]}])
+    expected = (False, False, True, False)
+    for entry, exp in zip(entries, expected):
+        assert filter(entry=entry) is exp
+
 
 def test_filter_numeric_with_error():
     filter = Filter(filters=[{"field": [{"numeric": [">", 0]}]}])
     with pytest.raises(TypeError):
         filter(entry={"field": "a"})
 
-    filter = Filter(filters=[{"field": [{"numeric": [">", 0, "<="]}]}])
     with pytest.raises(ValueError):
-        filter(entry={"field": 1})
+        Filter(filters=[{"field": [{"numeric": [">", 0, "<="]}]}])
 
 
 def test_filter_exists():
@@ -173,7 +180,90 @@ def test_filter_wrong_type():
         {"field": "value two"},
     ]
 
-    filter = Filter(filters=[{"field": [{"invalid-type": None, "another": None}]}])
-
     with pytest.raises(TypeError):
-        filter(entry={"field": None})
+        Filter(filters=[{"field": [{"invalid-type": None, "another": None}]}])
+
+
+def test_filter_mapping_types():
+    filter = Filter(filters=[{"field": ["value"]}])
+
+    assert filter(entry=MappingProxyType({"field": "value"})) is True
+    assert filter(entry=[("field", "value")]) is True
+    assert filter(entry=[("field", "other")]) is False
+
+
+def test_filter_apply_dataframe():
+    entries = [
+        {"field": "value", "number": 1, "nested": {"field": "prefix-1"}},
+        {"field": "other", "number": 5, "nested": {"field": "prefix-2"}},
+        {"field": "value", "number": 10, "nested": {"field": "none"}},
+        {"field": "other", "number": 7, "nested": {"field": "prefix-3"}},
+    ]
+    dataframe = pd.json_normalize(entries)
+
+    filters = [
+        [{"field": ["value"], "number": [{"numeric": [">", 2]}]}],
+        [
+            {
+                "field": [{"anything-but": ["value"]}],
+                "nested": {"field": [{"prefix": "prefix"}]},
+            }
+        ],
+        [{"field": ["value"]}, {"number": [{"numeric": [">=", 5, "<", 7]}]}],
+        [{"missing": [{"exists": False}]}],
+        [{"missing": [{"exists": True}]}],
+        [],
+    ]
+    for filters_ in filters:
+        filter = Filter(filters=filters_)
+        expected = [filter(entry=entry) for entry in entries]
+        assert filter.apply(dataframe=dataframe).tolist() == expected
+
+
+def test_filter_apply_mixed_object_column():
+    dataframe = pd.DataFrame(
+        {
+            "field": [None, 1, "prefix-1", np.nan, "other"],
+            "number": [1.0, np.nan, 2.0, np.nan, 3.0],
+        }
+    )
+    entries = dataframe.to_dict(orient="records")
+
+    filters = [
+        [{"field": [{"exists": True}]}],
+        [{"field": [{"exists": False}]}],
+        [{"field": [None]}],
+        [{"field": [{"prefix": "prefix"}]}],
+        [{"field": [{"anything-but": [1]}]}],
+        [{"field": [{"anything-but": [np.nan, None]}]}],
+        [{"number": [{"anything-but": [np.nan]}]}],
+        [{"number": [{"anything-but": [np.nan, 2.0]}]}],
+        [{"field": [1, "other"]}],
+    ]
+    for filters_ in filters:
+        filter = Filter(filters=filters_)
+        expected = [filter(entry=entry) for entry in entries]
+        assert filter.apply(dataframe=dataframe).tolist() == expected
+
+
+def test_filter_apply_nullable_dtypes():
+    dataframe = pd.DataFrame(
+        {
+            "number": pd.array([1, None, 5], dtype="Int64"),
+            "field": pd.array(["prefix-1", None, "other"], dtype="string"),
+            "flag": pd.array([True, None, False], dtype="boolean"),
+        }
+    )
+
+    filters = [
+        ([{"number": [1]}], [True, False, False]),
+        ([{"number": [{"numeric": [">", 2]}]}], [False, False, True]),
+        ([{"number": [{"numeric": [">", 0, "<", 2]}]}], [True, False, False]),
+        ([{"field": ["other"]}], [False, False, True]),
+        ([{"field": [{"prefix": "prefix"}]}], [True, False, False]),
+        ([{"flag": [True]}], [True, False, False]),
+        ([{"flag": [{"exists": True}]}], [True, True, True]),
+    ]
+    for filters_, expected in filters:
+        filter = Filter(filters=filters_)
+        assert filter.apply(dataframe=dataframe).tolist() == expected
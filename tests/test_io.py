@@ -1,197 +1,137 @@
+import io
 import os
+import multiprocessing
 import unittest
+from unittest import mock
 import shutil
 import tempfile
+from gzip import GzipFile
+from itertools import product
 
-import boto3
 import pytest
+import numpy as np
 import pandas as pd
-from moto import mock_s3
 
 from datatoolz.filesystem import FileSystem
 
+SAMPLE_DF = pd.DataFrame(
+    {
+        "col1": ["a", "a", "b", "b", "b"],
+        "col2": [1, 1, 1, 1, 2],
+        "col3": [1, None, 123, -42, 0],
+    }
+)
+
+FORMATS = [
+    {"filetype": "dsv", "gzip": gzip, "sep": "|", "header": header}
+    for gzip, header in product((False, True), (True, False))
+]
+FORMATS += [{"filetype": "jsonlines", "gzip": gzip} for gzip in (True, False)]
+FORMATS += [{"filetype": "parquet"}]
+
+
+@pytest.fixture(scope="module")
+def s3_bucket():
+    # moto and boto3 are slow to import, only load them for the s3 cases
+    import boto3
+    from moto import mock_s3
+
+    with mock_s3():
+        bucket_name = "test_bucket"
+        boto3.client("s3").create_bucket(Bucket=bucket_name)
+        yield bucket_name
+
+
+@pytest.mark.parametrize("filesystem", ["local", "memory", "s3"])
+@pytest.mark.parametrize(
+    "params",
+    FORMATS,
+    ids=lambda params: ",".join(f"{key}={value}" for key, value in params.items()),
+)
+def test_write_read_basics(filesystem, params, tmp_path, request):
+    from datatoolz.io import DataIO
+
+    dio = DataIO(filesystem=FileSystem(filesystem))
+
+    filetype = params["filetype"]
+    if filesystem == "s3":
+        # the mocked bucket is shared by the module, keys are prefixed per test
+        root = f"{request.getfixturevalue('s3_bucket')}/{tmp_path.name}"
+    elif filesystem == "memory":
+        root = f"memory://{tmp_path.name}"
+    else:
+        root = tmp_path.as_posix()
+    path = f"{root}/{filetype}/my-file.{filetype}"
+
+    dio.write(
+        dataframe=SAMPLE_DF,
+        path=path,
+        filetype=filetype,
+        gzip=params.get("gzip"),
+        sep=params.get("sep"),
+        header=params.get("header"),
+    )
+
+    df = dio.read(
+        path=path,
+        filetype=filetype,
+        gzip=params.get("gzip"),
+        sep=params.get("sep"),
+        header=0 if params.get("header") else None,
+    )
+
+    assert SAMPLE_DF.shape == df.shape
+
+    if filetype == "parquet":
+        df = dio.read(path=path, buffer_size=None, pre_buffer=False)
+        assert SAMPLE_DF.shape == df.shape
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+@pytest.mark.parametrize("filesystem", ["local", "s3"])
+def test_read_write_in_forked_child(filesystem, tmp_path, request):
+    from datatoolz.io import DataIO
+
+    fs = FileSystem(filesystem)
+    dio = DataIO(filesystem=fs)
+    if filesystem == "s3":
+        path = f"{request.getfixturevalue('s3_bucket')}/{tmp_path.name}"
+    else:
+        path = tmp_path.as_posix()
+    # the parent starts the shared pool threads (and s3 clients) before forking
+    dio.write(dataframe=SAMPLE_DF, path=f"{path}/parent", partition_by=["col1"])
+    assert dio.read(path=f"{path}/parent").shape[0] == SAMPLE_DF.shape[0]
+    parent_filesystem = fs.filesystem
+
+    def _child():
+        dio.write(dataframe=SAMPLE_DF, path=f"{path}/child", partition_by=["col1"])
+        df = dio.read(path=f"{path}/child")
+        if filesystem == "s3" and fs.filesystem is parent_filesystem:
+            os._exit(2)
+        os._exit(0 if df.shape[0] == SAMPLE_DF.shape[0] else 1)
+
+    process = multiprocessing.get_context("fork").Process(target=_child)
+    process.start()
+    process.join(timeout=60)
+    if process.is_alive():
+        process.kill()
+        pytest.fail("forked child did not finish")
+    assert process.exitcode == 0
+
 
-@mock_s3
 class TestDataIO(unittest.TestCase):
+    sample_df = SAMPLE_DF
+
     def setUp(self):
         # Create a temporary directory
         self.test_dir = tempfile.mkdtemp()
 
-        self.bucket_name = "test_bucket"
-        s3 = boto3.client("s3")
-        s3.create_bucket(Bucket=self.bucket_name)
-
-        self.sample_df = pd.DataFrame(
-            {
-                "col1": ["a", "a", "b", "b", "b"],
-                "col2": [1, 1, 1, 1, 2],
-                "col3": [1, None, 123, -42, 0],
-            }
-        )
-
-        self.params = [
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "jsonlines",
-                "gzip": True,
-            },
-            {
-                "filesystem": "local",
-                "path": self.test_dir,
-                "filetype": "jsonlines",
-                "gzip": False,
-            },
-            {"filesystem": "local", "path": self.test_dir, "filetype": "parquet"},
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "dsv",
-                "gzip": False,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": True,
-            },
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "dsv",
-                "gzip": True,
-                "sep": "|",
-                "header": False,
-            },
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "jsonlines",
-                "gzip": True,
-            },
-            {
-                "filesystem": "s3",
-                "path": self.bucket_name,
-                "filetype": "jsonlines",
-                "gzip": False,
-            },
-            {"filesystem": "s3", "path": self.bucket_name, "filetype": "parquet"},
-        ]
-
     def tearDown(self):
         # Remove the directory after the test
         shutil.rmtree(self.test_dir)
 
-    def test_write_read_basics(self):
-        from datatoolz.io import DataIO
-
-        for i, params in enumerate(self.params):
-            filesystem = FileSystem(params["filesystem"])
-
-            dio = DataIO(filesystem=filesystem)
-
-            path = os.path.join(
-                params["path"],
-                str(i),
-                params["filetype"],
-                f"my-file.{params['filetype']}",
-            )
-
-            dio.write(
-                dataframe=self.sample_df,
-                path=path,
-                filetype=params["filetype"],
-                gzip=params.get("gzip"),
-                sep=params.get("sep"),
-                header=params.get("header"),
-            )
-
-            df = dio.read(
-                path=path,
-                filetype=params["filetype"],
-                gzip=params.get("gzip"),
-                sep=params.get("sep"),
-                header=0 if params.get("header") else None,
-            )
-
-            assert self.sample_df.shape == df.shape
-
     def test_unsupported_filetype(self):
         from datatoolz.io import DataIO
 
@@ -203,7 +143,7 @@ class TestDataIO(unittest.TestCase):
                 dataframe=self.sample_df, path=self.test_dir, filetype="unsupported"
             )
 
-        dio.write(dataframe=self.sample_df, path=path)
+        # the filetype is validated before anything is listed or read
         with pytest.raises(ValueError):
             dio.read(path=path, filetype="unsupported")
 
@@ -218,7 +158,7 @@ class TestDataIO(unittest.TestCase):
         path = os.path.join(self.test_dir, "parts1", "my-file")
         dio.write(dataframe=self.sample_df, path=path, partition_by=partition_by)
         files = filesystem.find(path=path)
-        assert len(files) == self.sample_df[partition_by].drop_duplicates().shape[0]
+        assert len(files) == self.sample_df[partition_by[0]].nunique()
         df = dio.read(path=files[0])
         head, suffix = os.path.split(files[0])
         col, val = os.path.split(head)[1].split("=")
@@ -231,6 +171,13 @@ class TestDataIO(unittest.TestCase):
             partition_by=partition_by,
             drop_partitions=True,
         )
+        partition_dirs = {
+            os.path.basename(os.path.dirname(f)) for f in filesystem.find(path=path)
+        }
+        assert partition_dirs == {
+            f"{partition_by[0]}={value}"
+            for value in self.sample_df[partition_by[0]].unique()
+        }
         df = dio.read(path=path)
         assert df.shape == (
             self.sample_df.shape[0],
@@ -240,6 +187,186 @@ class TestDataIO(unittest.TestCase):
             col for col in self.sample_df.columns if col not in partition_by
         ]
 
+    def test_write_dsv_values(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+
+        for values in (["a", "b c", "", "d\\"], ["a", 'b"c', "d\te", "f\ng"]):
+            dataframe = pd.DataFrame({"text": values, "number": range(len(values))})
+            path = os.path.join(self.test_dir, "dsv-values", str(len(values)))
+            for gzip in (False, True):
+                dio.write(
+                    dataframe=dataframe,
+                    path=path,
+                    filetype="dsv",
+                    gzip=gzip,
+                    suffix="file",
+                )
+                with open(os.path.join(path, "file"), "rb") as file_object:
+                    content = file_object.read()
+                if gzip:
+                    content = GzipFile(fileobj=io.BytesIO(content)).read()
+                assert content == dataframe.to_csv(index=False, sep="\t").encode()
+
+    def test_read_jsonlines_values(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+
+        payloads = [
+            b'{"a": 1, "b": 1.5, "c": "x", "d": true}\n{"a": 2, "b": null, "c": "", "d": false}\n',
+            b'{"a": 1, "b": null}\n{"a": null, "c": "x"}\n',
+            b'{"a": 1, "b": 2}\n{"a": null, "b": 3}\n',
+            b'{"t": "2021-01-01 00:00:00"}\n',
+            b'{"a": "x"}\n{"a": null}\n',
+            b'{"a": {"b": 1}, "l": [1, 2]}\n',
+            b'{"created_at": "2021-01-01", "date": "2021-01-01"}\n',
+            b'{"a": 1}\n{"a": "x"}\n',
+            b'{"a": 18446744073709551615}\n{"a": 1}\n',
+            b'{"a": 1.5}\n{"a": null}\n',
+        ]
+        for i, payload in enumerate(payloads):
+            for gzip in (False, True):
+                path = os.path.join(self.test_dir, "jsonlines-values", str(i), "file")
+                FileSystem().makedirs(os.path.dirname(path), exist_ok=True)
+                with GzipFile(path, "wb") if gzip else open(path, "wb") as fo:
+                    fo.write(payload)
+
+                df = dio.read(path=path, filetype="jsonlines", gzip=gzip)
+                expected = pd.read_json(
+                    io.BytesIO(payload), orient="records", lines=True, dtype=False
+                )
+                pd.testing.assert_frame_equal(df, expected)
+
+        # floats are parsed correctly rounded, unlike pandas' default parser
+        values = ["5e-324", "5.04686855817390240618e-13", "123456789.12345678"]
+        path = os.path.join(self.test_dir, "jsonlines-values", "floats")
+        with open(path, "wb") as fo:
+            fo.write("".join(f'{{"a": {value}}}\n' for value in values).encode())
+        df = dio.read(path=path, filetype="jsonlines")
+        assert df["a"].tolist() == [float(value) for value in values]
+
+    def test_read_dsv_values(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+
+        payloads = [
+            b"a\tb\tc\n1\t2\t3\n4\t5\n",
+            b"a\tb\n1\t2\t3\n4\t5\t6\n",
+            b"a\ta\tb\n1\t2\t3\n",
+            b"\tx\n0\tp\n1\tq\n",
+        ]
+        for i, payload in enumerate(payloads):
+            path = os.path.join(self.test_dir, "dsv-values", str(i), "file")
+            FileSystem().makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fo:
+                fo.write(payload)
+
+            df = dio.read(path=path, filetype="dsv")
+            expected = pd.read_csv(
+                io.BytesIO(payload),
+                dtype=str,
+                keep_default_na=False,
+                sep="\t",
+                escapechar="\\",
+            ).reset_index(drop=True)
+            pd.testing.assert_frame_equal(df, expected)
+
+        # files parsed by pyarrow and by the pandas fallback are combined
+        path = os.path.join(self.test_dir, "dsv-values", "mixed")
+        FileSystem().makedirs(path, exist_ok=True)
+        payloads = [b"1\t2\n", b"3\t4\n5\n"]
+        for i, payload in enumerate(payloads):
+            with open(os.path.join(path, str(i)), "wb") as fo:
+                fo.write(payload)
+        df = dio.read(path=path, filetype="dsv", header=None)
+        expected = pd.concat(
+            [
+                pd.read_csv(
+                    io.BytesIO(payload),
+                    dtype=str,
+                    keep_default_na=False,
+                    sep="\t",
+                    escapechar="\\",
+                    header=None,
+                )
+                for payload in payloads
+            ],
+            ignore_index=True,
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_read_parquet_schema_drift(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+
+        path = os.path.join(self.test_dir, "parquet-drift")
+        os.makedirs(path)
+        parts = [
+            pd.DataFrame({"a": [1, 2]}),
+            pd.DataFrame({"a": [1.5, None], "b": ["x", "y"]}),
+            pd.DataFrame({"b": ["z"], "a": [3]}),
+        ]
+        for i, part in enumerate(parts):
+            part.to_parquet(os.path.join(path, f"part-{i}.parquet"))
+
+        df = dio.read(path=path)
+        pd.testing.assert_frame_equal(df, pd.concat(parts).reset_index(drop=True))
+
+    def test_write_read_utf8(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+        dataframe = pd.DataFrame(
+            {"text": ["zażółć", "gęślą", "jaźń"], "number": [1, 2, 3]}
+        )
+
+        for filetype in ("dsv", "jsonlines"):
+            for gzip in (False, True):
+                path = os.path.join(self.test_dir, "utf8", filetype, str(gzip))
+                dio.write(dataframe=dataframe, path=path, filetype=filetype, gzip=gzip)
+                df = dio.read(path=path, filetype=filetype, gzip=gzip)
+                assert df["text"].tolist() == dataframe["text"].tolist()
+
+    def test_write_many_partitions(self):
+        from datatoolz.io import DataIO
+
+        filesystem = FileSystem()
+        dio = DataIO(filesystem=filesystem)
+
+        dataframe = pd.DataFrame({"key": np.arange(1100), "value": np.arange(1100)})
+        path = os.path.join(self.test_dir, "many-parts")
+        dio.write(
+            dataframe=dataframe, path=path, partition_by=["key"], drop_partitions=True
+        )
+        assert len(filesystem.find(path=path)) == dataframe.shape[0]
+
+    def test_write_partitions_keep_row_order(self):
+        from datatoolz.io import DataIO
+
+        dio = DataIO(filesystem=FileSystem())
+
+        rows = 300_000
+        dataframe = pd.DataFrame({"key": np.arange(rows) % 3, "value": np.arange(rows)})
+        path = os.path.join(self.test_dir, "ordered-parts")
+        # drop_partitions takes the single-call dataset writer
+        with mock.patch.object(
+            dio, "_write_dataset", wraps=dio._write_dataset
+        ) as write_dataset:
+            dio.write(
+                dataframe=dataframe,
+                path=path,
+                partition_by=["key"],
+                drop_partitions=True,
+            )
+        write_dataset.assert_called_once()
+        for key in range(3):
+            df = dio.read(path=f"{path}/key={key}")
+            assert df["value"].tolist() == list(range(key, rows, 3))
+
     def test_write_custom_partition_formatting(self):
         from datatoolz.io import DataIO
 
@@ -281,17 +408,14 @@ class TestDataIO(unittest.TestCase):
         partition_data = self.sample_df[partition_by].drop_duplicates()
         assert len(files) == partition_data.shape[0]
 
-        files = [os.path.dirname(f) for f in files]
+        directories = {os.path.dirname(f) for f in files}
 
-        for _, x in partition_data.iterrows():
-            partition_name = list()
-            for i, col in enumerate(partition_by):
-                if i == 0:
-                    partition_name.append(x[col])
-                else:
-                    partition_name.append(f"{col}*{x[col]}")
-            partition_name = os.path.join(path, *partition_name)
-            assert partition_name in files
+        rest = partition_by[1:]
+        for first, *values in partition_data.itertuples(index=False, name=None):
+            partition_name = "/".join(
+                [path, f"{first}", *(f"{col}*{v}" for col, v in zip(rest, values))]
+            )
+            assert partition_name in directories
 
         with pytest.raises(ValueError):
             dio.get_path(
@@ -321,6 +445,14 @@ class TestDataIO(unittest.TestCase):
         df = dio.read(path=path)
         assert self.sample_df.shape == df.shape
 
+        path = os.path.join(self.test_dir, "multi-suffix-default", "my-file")
+        dio.write(dataframe=self.sample_df, path=path, suffix=[None, None])
+        files = filesystem.find(path=path)
+        assert len(set(files)) == 2
+
+        df = dio.read(path=path)
+        assert self.sample_df.shape == df.shape
+
     def test_tsv_deprecation(self):
         from datatoolz.io import DataIO
 
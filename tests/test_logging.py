@@ -46,6 +46,120 @@ class TestLogging(object):
             if k != "msg":
                 assert log["extra"][k] == v
 
+    def test_logger_epoch_timestamps(self, capsys):
+        import time
+        import datatoolz.logging as logging
+
+        logger = logging.JsonLogger(name="epoch-logger", iso_timestamps=False)
+
+        t_start = time.time_ns()
+        logger.info(msg="msg-epoch")
+        t_end = time.time_ns()
+
+        out, _ = capsys.readouterr()
+        log = json.loads(out)
+
+        assert "timestamp" not in log
+        assert t_start <= log["ts_ns"] <= t_end
+        assert log["message"] == "msg-epoch"
+
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    def test_logger_big_integers(self, capsys, with_orjson):
+        from unittest import mock
+        import datatoolz.logging as logging
+
+        orjson = logging.orjson if with_orjson else None
+        with mock.patch.object(logging, "orjson", orjson):
+            logger = logging.JsonLogger(name="big-int-logger")
+            logger.info(msg="msg-big-int", number=2**64, negative=-(2**70))
+
+            out, _ = capsys.readouterr()
+            log = json.loads(out)
+
+            assert log["message"] == "msg-big-int"
+            assert log["extra"] == {"number": 2**64, "negative": -(2**70)}
+
+            # values json cannot serialize fail the same way without orjson
+            with pytest.raises(TypeError):
+                logger.info(msg="msg-object", value=object())
+
+    def test_logger_batched_flush(self):
+        import io
+        import datatoolz.logging as logging
+
+        class Stream(io.StringIO):
+            flushes = 0
+
+            def flush(self):
+                self.flushes += 1
+
+        logger = logging.JsonLogger(name="batch-logger", flush_records=3)
+        stream = Stream()
+        logger.logger.handlers[0].setStream(stream)
+        stream.flushes = 0
+
+        for i in range(4):
+            logger.info(msg=f"msg-{i}")
+        assert stream.flushes == 1
+        logger.error(msg="msg-error")
+        assert stream.flushes == 2
+        assert [
+            json.loads(line)["message"] for line in stream.getvalue().splitlines()
+        ] == [
+            "msg-0",
+            "msg-1",
+            "msg-2",
+            "msg-3",
+            "msg-error",
+        ]
+
+    def test_logger_reinitialization(self, capsys):
+        import sys
+        import logging as std_logging
+        import datatoolz.logging as logging
+
+        for _ in range(2):
+            std_logging.getLogger("reused-logger").addHandler(
+                std_logging.StreamHandler(sys.stdout)
+            )
+        for _ in range(3):
+            logger = logging.JsonLogger(name="reused-logger", env="test")
+        assert len(logger.logger.handlers) == 1
+
+        logger.info(msg="once")
+        out, _ = capsys.readouterr()
+        assert len(out.splitlines()) == 1
+
+    def test_logger_reinitialization_foreign_handler(self, tmp_path):
+        import logging as std_logging
+        import datatoolz.logging as logging
+
+        path = tmp_path / "shared.log"
+        handler = std_logging.FileHandler(path, mode="w")
+        std_logging.getLogger("foreign-logger").addHandler(handler)
+        std_logging.getLogger("other-logger").addHandler(handler)
+
+        logger = logging.JsonLogger(name="foreign-logger")
+        assert handler not in logger.logger.handlers
+
+        # the handler is removed, but still usable by the loggers sharing it
+        std_logging.getLogger("other-logger").warning("still open")
+        handler.close()
+        assert path.read_text() == "still open\n"
+
+    def test_logger_disabled_level(self, capsys):
+        import logging as std_logging
+        import datatoolz.logging as logging
+
+        logger = logging.JsonLogger(name="quiet-logger", env="test")
+        logger.logger.setLevel(std_logging.ERROR)
+
+        logger.info(msg="skipped")
+        logger.error(msg="logged")
+
+        out, _ = capsys.readouterr()
+        assert [json.loads(line)["message"] for line in out.splitlines()] == ["logged"]
+
     def test_logger_decorator(self, capsys):
         import datatoolz.logging as logging
 
@@ -60,6 +174,7 @@ class TestLogging(object):
             return a + b, a * b
 
         my_func(42, 2)
+        assert my_func.__name__ == "my_func"
 
         log, _ = capsys.readouterr()
         log = json.loads(log)
@@ -68,6 +183,33 @@ class TestLogging(object):
         assert log["level"] == "info"
         assert log["extra"]["function"] == "my_func"
         assert log["extra"]["duration"] >= 0
-        assert log["extra"]["memory"]["peak"] >= 0
+        assert log["extra"]["memory"]["rss_delta_kb"] >= 0
+        assert log["extra"]["memory"]["rss_peak_kb"] > 0
         assert log["extra"]["static_value"] == "my-value"
         assert log["extra"]["length"] == 2
+
+    def test_logger_decorator_tracemalloc(self, capsys):
+        import tracemalloc
+        import datatoolz.logging as logging
+
+        logger = logging.JsonLogger(name="json-logger", env="test")
+
+        @logger.decorate(msg="allocating", memory="tracemalloc")
+        def my_func(n):
+            return list(range(n))
+
+        my_func(1000)
+
+        log, _ = capsys.readouterr()
+        log = json.loads(log)
+
+        assert log["extra"]["memory"]["peak"] > 0
+        assert not tracemalloc.is_tracing()
+
+        @logger.decorate(msg="failing", memory="tracemalloc")
+        def my_failing_func():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            my_failing_func()
+        assert not tracemalloc.is_tracing()